@@ -2,6 +2,9 @@ import streamlit as st
 import pandas as pd
 import os
 import time
+from src.aggregates import load_aggregates
+from src.long_store import read_pivot, load_schema, BASE_FIELDS
+from src.normalize import apply_dtypes
 
 # 1. 페이지 설정
 st.set_page_config(
@@ -12,17 +15,42 @@ st.set_page_config(
 st.title("📊 누리장터 입찰공고 실시간 크롤링 대시보드")
 st.markdown("---")
 
-EXCEL_FILE = "data/nuri_data.xlsx"
+DATA_DIR = "data"
+LONG_DB = os.path.join(DATA_DIR, "nuri_long.db")
+# 표에 기본으로 보여줄 컬럼 (저장된 항목 중 존재하는 것만)
+DEFAULT_COLUMNS = ["수집ID", "공고명", "공고기관", "수요기관", "입찰방식", "추정가격", "게시일시", "수집일시"]
 
 # 2. 데이터 로드
-def load_data():
-    if not os.path.exists(EXCEL_FILE):
+# 세로형 저장소에서 선택한 컬럼만 펼쳐 읽고, 저장소가 변경된 경우에만 다시 읽음
+@st.cache_data(show_spinner=False)
+def _read_pivot(mtime, columns):
+    return apply_dtypes(pd.DataFrame(read_pivot(DATA_DIR, list(columns)), columns=list(columns)))
+
+def _store_mtime():
+    # WAL 모드에서는 -wal 파일만 갱신될 수 있으므로 함께 확인
+    return max(os.path.getmtime(path) for path in (LONG_DB, LONG_DB + "-wal") if os.path.exists(path))
+
+def load_data(columns):
+    if not os.path.exists(LONG_DB) or not columns:
         return pd.DataFrame()
     try:
-        return pd.read_excel(EXCEL_FILE)
+        return _read_pivot(_store_mtime(), tuple(columns))
     except Exception:
         return pd.DataFrame()
 
+def available_columns():
+    schema = load_schema(DATA_DIR)
+    field_names = list(schema.field_ids()) if schema else []
+    return list(BASE_FIELDS) + field_names + ["첨부파일_개수", "첨부파일_목록"]
+
+# 상위 N개 항목만 차트용 Series로 변환
+def to_series(counts, top=None, sort_index=False):
+    series = pd.Series(counts, dtype="int64")
+    if sort_index:
+        return series.sort_index()
+    series = series.sort_values(ascending=False)
+    return series.head(top) if top else series
+
 # 3. 사이드바 
 with st.sidebar:
     st.header("⚙️ 모니터링 설정")
@@ -32,22 +60,50 @@ with st.sidebar:
         st.rerun()
     
     st.markdown("---")
-    st.info("크롤러가 생성한 엑셀 파일을\n실시간으로 시각화합니다.")
+    all_columns = available_columns()
+    columns = st.multiselect(
+        "표시할 컬럼",
+        all_columns,
+        default=[col for col in DEFAULT_COLUMNS if col in all_columns]
+    )
+
+    st.markdown("---")
+    st.info("크롤러가 저장한 공고 데이터를\n실시간으로 시각화합니다.")
 
 
 # 4. 메인 화면
-df = load_data()
+# 요약 지표와 차트는 저장 시점에 미리 계산된 집계 테이블 사용
+stats = load_aggregates()
+
+if stats and stats.get("total"):
+    col1, col2, col3 = st.columns(3)
+    col1.metric("📦 총 수집 공고", f"{stats['total']}건")
+    col2.metric("⏱️ 최근 수집", str(stats.get("last_crawled_at") or "-")[5:16])
+    if stats.get("price_count"):
+        col3.metric("💰 평균 추정가격", f"{stats['price_sum'] // stats['price_count']:,} 원")
+
+    st.subheader("📈 수집 현황")
+    chart1, chart2 = st.columns(2)
+    with chart1:
+        st.caption("게시일별 공고 수")
+        st.bar_chart(to_series(stats.get("per_day", {}), sort_index=True))
+    with chart2:
+        st.caption("공고기관 Top 10")
+        st.bar_chart(to_series(stats.get("per_agency", {}), top=10))
+
+    chart3, chart4 = st.columns(2)
+    with chart3:
+        st.caption("입찰방식")
+        st.bar_chart(to_series(stats.get("bid_method", {})))
+    with chart4:
+        st.caption("추정가격 분포")
+        st.bar_chart(pd.Series(stats.get("price_buckets", {}), dtype="int64"))
+
+df = load_data(columns)
 
 if df.empty:
-    st.warning("⚠️ 아직 데이터가 없습니다. 크롤러가 10개 이상 수집할 때까지 기다려주세요.")
+    st.warning("⚠️ 아직 데이터가 없습니다. 크롤러가 공고를 수집할 때까지 기다려주세요.")
 else:
-    # 주요 지표
-    col1, col2, col3 = st.columns(3)
-    col1.metric("📦 총 수집 공고", f"{len(df)}건")
-    
-    last_time = df['수집일시'].max() if '수집일시' in df.columns else "-"
-    col2.metric("⏱️ 최근 수집", str(last_time)[5:16]) 
-    
 
     # 검색 필터
     st.subheader("🔍 데이터 검색")
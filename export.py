@@ -0,0 +1,45 @@
+import argparse
+import os
+import sys
+import time
+
+from src.exporter import export_records, WRITERS
+from src.long_store import load_schema
+
+# 저장된 JSONL 데이터를 조건에 맞게 xlsx/CSV/Parquet 파일로 내보내기
+def main():
+    parser = argparse.ArgumentParser(description="누리장터 수집 데이터 내보내기")
+    parser.add_argument("--format", choices=list(WRITERS), default="xlsx", help="Output format (default: xlsx)")
+    parser.add_argument("--out", type=str, help="Output file path (default: data/nuri_export.<format>)")
+    parser.add_argument("--input", type=str, default="data/nuri_data.jsonl", help="Source JSONL file")
+    parser.add_argument("--start", type=str, help="Posting date from (YYYYMMDD)")
+    parser.add_argument("--end", type=str, help="Posting date to (YYYYMMDD)")
+    parser.add_argument("--agency", type=str, help="Agency name contains")
+    parser.add_argument("--keyword", type=str, help="Keyword in title, general info or file names")
+    parser.add_argument("--columns", type=str, help="Comma-separated columns to export (default: all)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Rows per write chunk (default: 1000)")
+    args = parser.parse_args()
+
+    for value in (args.start, args.end):
+        if value and (len(value) != 8 or not value.isdigit()):
+            print(f"[ERROR] 날짜({value})는 8자리 숫자여야 합니다.")
+            sys.exit(1)
+
+    if not os.path.exists(args.input):
+        print(f"[ERROR] 파일이 없습니다: {args.input}")
+        sys.exit(1)
+
+    out_path = args.out or os.path.join("data", f"nuri_export.{args.format}")
+    columns = [col.strip() for col in args.columns.split(",") if col.strip()] if args.columns else None
+    schema = load_schema(os.path.dirname(args.input))
+
+    started = time.perf_counter()
+    count = export_records(
+        args.input, out_path, fmt=args.format, chunk_size=args.chunk_size,
+        start_date=args.start, end_date=args.end, agency=args.agency, keyword=args.keyword,
+        columns=columns, schema=schema
+    )
+    print(f"[INFO] {count}건 내보내기 완료: {out_path} ({time.perf_counter() - started:.1f}s)")
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,34 @@
 import argparse
+import os
 import sys
+import socket
 import asyncio
 from datetime import datetime, timedelta
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-from src.storage import DataStorage
+from src.storage import DataStorage, load_visited_ids
+from src.work_queue import WorkQueue
+from src.governor import RateGovernor
+from src.watchdog import MemoryWatchdog
+from src.diagnostics import NoticeDiagnostics
+from src.alerts import AlertEngine
+from src.watermark import CrawlWatermark
+from src.logger import setup_logging, get_logger
 from src.crawler import NuriCrawler
-from src.utils import get_today_str, get_yesterday_str
+from src.api_crawler import NuriApiCrawler
+
+logger = get_logger("main")
 
 def validate_arguments(args):
-    if args.mode == "history":
+    # Coordinator 모드는 날짜를 지정한 경우에만 작업을 등록
+    if args.mode == "history" or (args.mode == "coordinator" and (args.start or args.end)):
         if not args.start or not args.end:
             print("[ERROR] 'history' 모드는 --start와 --end 날짜가 필수입니다.")
             sys.exit(1)
+
+        if args.start_page < 1:
+            print(f"[ERROR] --start-page 값은 1 이상이어야 합니다. (입력값: {args.start_page})")
+            sys.exit(1)
         
         try:
             # 날짜 포맷 검증
@@ -55,16 +71,41 @@ def validate_arguments(args):
             print(f"[ERROR] --hour 값은 0부터 23 사이의 정수여야 합니다. (입력값: {args.hour})")
             sys.exit(1)
 
+    if args.engine == "api" and not (1 <= args.concurrency <= 32):
+        print(f"[ERROR] --concurrency 값은 1부터 32 사이여야 합니다. (입력값: {args.concurrency})")
+        sys.exit(1)
+
+    if not (0 < args.rate <= args.max_rate):
+        print(f"[ERROR] --rate 값은 0보다 크고 --max-rate({args.max_rate}) 이하여야 합니다. (입력값: {args.rate})")
+        sys.exit(1)
+
     # 불필요 파라미터 경고 (무시 처리)
-    if args.mode != "history" and (args.start or args.end):
+    if args.mode not in ("history", "coordinator") and (args.start or args.end):
         print("[WARN] 현재 모드에서는 --start, --end 파라미터가 무시됩니다.")
 
     return True
 
-async def run_task(mode, args, storage):
+# 같은 상태 파일을 쓰는 모든 프로세스가 요청 한도를 공유 (프로세스당 하나만 생성하여 수집마다 속도를 초기화하지 않음)
+def create_governor(args):
+    return RateGovernor(rate=args.rate, max_rate=args.max_rate, state_path=args.rate_state)
+
+def create_crawler(args, governor):
+    # 공고 N건마다 또는 메모리 임계치 초과 시 브라우저 컨텍스트 재생성
+    watchdog = MemoryWatchdog(max_notices=args.recycle_every, max_heap_mb=args.max_heap_mb, max_rss_mb=args.max_rss_mb)
+    # 느린/실패 공고 진단 (기본 사용 안 함)
+    diagnostics = None
+    if args.diagnostics != "off":
+        diagnostics = NoticeDiagnostics(mode=args.diagnostics, slow_threshold=args.slow_threshold)
 
     # 디버깅 시 False
-    crawler = NuriCrawler(headless=True) 
+    if args.engine == "api":
+        return NuriApiCrawler(headless=True, concurrency=args.concurrency, profile_path=args.api_profile,
+                              governor=governor, watchdog=watchdog, diagnostics=diagnostics)
+    return NuriCrawler(headless=True, governor=governor, watchdog=watchdog, diagnostics=diagnostics)
+
+async def run_task(mode, args, storage, governor):
+
+    crawler = create_crawler(args, governor)
 
     try:
         await crawler.start_browser()
@@ -72,19 +113,19 @@ async def run_task(mode, args, storage):
         # 날짜 범위 설정
         start_date = ""
         end_date = ""
-        stop_on_duplicate = False
+        watermark = None
 
         if mode == "history":
             start_date = args.start
             end_date = args.end
-            # History 모드는 중복이 있어도 멈추지 않고 기간 내 데이터를 모두 갱신/확인
-            stop_on_duplicate = False 
+            cutoff = start_date
+            boundary_ids = None
         else:
-            # Interval / Cron 모드
-            start_date = get_yesterday_str()
-            end_date = get_today_str()
-            # 이미 수집한 데이터가 나오면 즉시 종료
-            stop_on_duplicate = True
+            # Interval / Cron 모드: 마지막 성공 수집 이후 구간만 검색 (중단 기간 자동 보충)
+            watermark = CrawlWatermark(args.watermark)
+            start_date, end_date = watermark.search_window()
+            cutoff = watermark.cutoff() or start_date
+            boundary_ids = watermark.boundary_ids
 
         # 검색 수행
         search_success = await crawler.search_period(start_date, end_date)
@@ -103,75 +144,205 @@ async def run_task(mode, args, storage):
                 
                 if data:
                     storage.save_data(data, notice_id)
+                    if watermark:
+                        watermark.observe(data)
                     return True
                 return False
 
-            # 페이지 순회 시작
+            # 페이지 순회 시작 (중복이 있어도 멈추지 않고 컷오프 경계 페이지까지 확인)
             await crawler.crawl_period_pages(
                 save_callback=save_callback,
-                stop_on_duplicate=stop_on_duplicate,
-                cutoff_date=start_date
+                cutoff_date=cutoff,
+                start_page=args.start_page if mode == "history" else 1,
+                boundary_ids=boundary_ids
             )
-            
+
+            # 모든 공고를 처리한 경우에만 워터마크 갱신 (실패 공고는 다음 수집에서 다시 시도)
+            if watermark:
+                if crawler.failed_notices:
+                    logger.warning("%d notices failed. Watermark not advanced.", crawler.failed_notices)
+                else:
+                    watermark.commit()
+
     except Exception as e:
-        print(f"[Error] Crawler task error: {e}")
+        logger.error("Crawler task error: %s", e)
     finally:
         await crawler.close_browser()
 
 
+# 작업 큐에서 날짜 구간을 받아 수집 (저장소에는 직접 쓰지 않음)
+async def run_worker(args, queue, governor):
+    worker_id = f"{socket.gethostname()}-{os.getpid()}"
+    # 이미 저장된 ID는 읽기 전용으로만 참조
+    visited = load_visited_ids(os.path.join("data", "visited_ids.txt"))
+    logger.info("Worker started. Known items: %d", len(visited), extra={"worker": worker_id})
+
+    while True:
+        task = queue.lease(worker_id)
+        if task is None:
+            stats = queue.stats()
+            # 코디네이터가 작업을 등록하기 전이면 계속 대기
+            if not queue.has_open_tasks() and (stats.get("done", 0) + stats.get("failed", 0)) > 0:
+                logger.info("No more tasks. Worker exiting.", extra={"worker": worker_id})
+                break
+            # 다른 워커가 처리 중인 작업의 임대 만료 대기
+            await asyncio.sleep(10)
+            continue
+
+        day = task["payload"]
+        logger.info("Leased shard %s (attempt %d)", day, task["attempts"], extra={"worker": worker_id})
+
+        # 임대 유지용 하트비트
+        async def heartbeat():
+            while True:
+                await asyncio.sleep(max(queue.lease_seconds // 3, 1))
+                if not queue.heartbeat(task["id"], worker_id):
+                    logger.warning("Lease lost for shard %s.", day, extra={"worker": worker_id})
+                    return
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        crawler = create_crawler(args, governor)
+
+        def save_callback(data, notice_id, check_only=False):
+            is_new = notice_id not in visited and not queue.has_result(notice_id)
+            if check_only:
+                return is_new
+            if data:
+                queue.push_result(notice_id, data)
+                return True
+            return False
+
+        try:
+            await crawler.start_browser()
+            if not await crawler.search_period(day, day):
+                raise Exception("search failed")
+            await crawler.crawl_period_pages(save_callback=save_callback, cutoff_date=day)
+            # 실패한 공고가 있으면 작업을 실패 처리하여 재시도 (이미 수집한 공고는 결과 테이블로 건너뜀)
+            if crawler.failed_notices:
+                raise Exception(f"{crawler.failed_notices} notices failed")
+            queue.complete(task["id"], worker_id)
+            logger.info("Shard %s done.", day, extra={"worker": worker_id})
+        except Exception as e:
+            logger.error("Shard %s failed: %s", day, e, extra={"worker": worker_id})
+            queue.fail(task["id"], worker_id, e)
+        finally:
+            heartbeat_task.cancel()
+            await crawler.close_browser()
+
+# 워커 결과를 저장소에 기록하는 단일 writer
+async def run_coordinator(args, queue, storage):
+    if args.start and args.end:
+        added = queue.enqueue_date_shards(args.start, args.end)
+        logger.info("%d date shards enqueued (%s ~ %s)", added, args.start, args.end)
+
+    while True:
+        results = queue.fetch_unwritten(limit=100)
+        for notice_id, data in results:
+            if storage.is_new(notice_id):
+                storage.save_data(data, notice_id)
+        queue.mark_written([notice_id for notice_id, _ in results])
+
+        if not results:
+            stats = queue.stats()
+            if not queue.has_open_tasks() and stats["unwritten"] == 0:
+                logger.info("All shards finished: %s", stats)
+                break
+            logger.info("Queue status: %s", stats)
+            await asyncio.sleep(5)
+
+
 def main():
     
     parser = argparse.ArgumentParser(description="누리장터 입찰공고 수집 시스템")
-    parser.add_argument("--mode", choices=["history", "interval", "cron"], required=True, help="Execution mode")
+    parser.add_argument("--mode", choices=["history", "interval", "cron", "coordinator", "worker"], required=True, help="Execution mode")
     parser.add_argument("--start", type=str, help="Start date (YYYYMMDD) for history mode")
     parser.add_argument("--end", type=str, help="End date (YYYYMMDD) for history mode")
     parser.add_argument("--interval", type=int, default=600, help="Interval seconds (default: 600)")
     parser.add_argument("--hour", type=int, default=9, help="Cron hour (0-23)")
+    parser.add_argument("--engine", choices=["browser", "api"], default="browser", help="Crawler engine (default: browser)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent detail requests for api engine (default: 8)")
+    parser.add_argument("--api-profile", type=str, default="data/api_profile.json", help="Learned API profile path for api engine")
+    parser.add_argument("--queue", type=str, default="data/work_queue.db", help="Shared work queue path for coordinator/worker modes")
+    parser.add_argument("--rate", type=float, default=2.0, help="Initial requests per second (default: 2.0)")
+    parser.add_argument("--max-rate", type=float, default=10.0, help="Upper bound of adaptive request rate (default: 10.0)")
+    parser.add_argument("--rate-state", type=str, default="data/governor.db", help="Shared rate limiter state file")
+    parser.add_argument("--recycle-every", type=int, default=300, help="Recycle browser context after N notices (0: off)")
+    parser.add_argument("--max-heap-mb", type=int, default=512, help="Recycle when renderer JS heap exceeds this (MB, 0: off)")
+    parser.add_argument("--max-rss-mb", type=int, default=2048, help="Recycle when crawler+browser RSS exceeds this (MB, 0: off)")
+    parser.add_argument("--diagnostics", choices=["off", "snapshot", "trace"], default="off", help="Capture slow/failed notices (default: off)")
+    parser.add_argument("--slow-threshold", type=float, default=15.0, help="Seconds per notice considered slow (default: 15)")
+    parser.add_argument("--watermark", type=str, default="data/watermark.json", help="Incremental crawl watermark for interval/cron modes")
+    parser.add_argument("--alert-rules", type=str, default="data/alert_rules.json", help="Keyword/agency alert rules file")
+    parser.add_argument("--log-level", type=str, help="Root log level (default: NURI_LOG_LEVEL or INFO)")
+    parser.add_argument("--log-format", choices=["json", "text"], help="Log output format (default: NURI_LOG_FORMAT or json)")
+    parser.add_argument("--start-page", type=int, default=1, help="List page to resume from in history mode (default: 1)")
     
     args = parser.parse_args()
 
     # 인자 검증
     validate_arguments(args)
 
+    # 큐 기반 비동기 로깅 시작
+    setup_logging(level=args.log_level, fmt=args.log_format)
+
+    # 요청 속도 제어기 (반복 수집/작업 단위와 관계없이 프로세스당 하나)
+    governor = create_governor(args)
+
+    # 워커는 저장소를 소유하지 않음 (코디네이터만 기록)
+    if args.mode == "worker":
+        logger.info("Starting Worker Mode")
+        asyncio.run(run_worker(args, WorkQueue(args.queue), governor))
+        return
+
+    # 알림 규칙 파일이 있으면 알림 사용
+    alert_engine = None
+    if args.alert_rules and os.path.exists(args.alert_rules):
+        alert_engine = AlertEngine.from_file(args.alert_rules)
+        logger.info("Alert rules loaded: %d", len(alert_engine.rules))
+
     # 저장소 초기화
-    storage = DataStorage()
-    print(f"[System] Storage loaded. Current items: {storage.get_stats()}")
+    storage = DataStorage(alert_engine=alert_engine)
+    logger.info("Storage loaded. Current items: %d", storage.get_stats())
 
     # 모드별 실행 로직
     if args.mode == "history":
         if not args.start or not args.end:
-            print("[ERROR] History mode requires --start and --end arguments.")
+            logger.error("History mode requires --start and --end arguments.")
             sys.exit(1)
             
-        print(f"[System] Starting History Mode: {args.start} ~ {args.end}")
-        asyncio.run(run_task("history", args, storage))
+        logger.info("Starting History Mode: %s ~ %s", args.start, args.end)
+        asyncio.run(run_task("history", args, storage, governor))
 
     elif args.mode == "interval":
-        print(f"[System] Starting Interval Mode (Every {args.interval}s)")
+        logger.info("Starting Interval Mode (Every %ds)", args.interval)
         scheduler = AsyncIOScheduler()
         
         # 첫 실행
-        scheduler.add_job(run_task, 'date', args=["interval", args, storage])
+        scheduler.add_job(run_task, 'date', args=["interval", args, storage, governor])
         # 주기적 실행
-        scheduler.add_job(run_task, 'interval', seconds=args.interval, args=["interval", args, storage])
+        scheduler.add_job(run_task, 'interval', seconds=args.interval, args=["interval", args, storage, governor])
         
         scheduler.start()
         try:
             asyncio.get_event_loop().run_forever()
         except (KeyboardInterrupt, SystemExit):
-            print("[System] Scheduler stopped.")
+            logger.info("Scheduler stopped.")
+
+    elif args.mode == "coordinator":
+        logger.info("Starting Coordinator Mode")
+        asyncio.run(run_coordinator(args, WorkQueue(args.queue), storage))
 
     elif args.mode == "cron":
-        print(f"[System] Starting Cron Mode (Daily at {args.hour}:00)")
+        logger.info("Starting Cron Mode (Daily at %d:00)", args.hour)
         scheduler = AsyncIOScheduler()
         
-        scheduler.add_job(run_task, 'cron', hour=args.hour, args=["cron", args, storage])
+        scheduler.add_job(run_task, 'cron', hour=args.hour, args=["cron", args, storage, governor])
         
         scheduler.start()
         try:
             asyncio.get_event_loop().run_forever()
         except (KeyboardInterrupt, SystemExit):
-            print("[System] Scheduler stopped.")
+            logger.info("Scheduler stopped.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
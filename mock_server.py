@@ -0,0 +1,182 @@
+import argparse
+import json
+import random
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 누리장터 목록/상세 API를 흉내내는 로컬 테스트 서버
+# API 엔진(--engine api)과 알림 웹훅(/webhook)을 실제 사이트 없이 검증하기 위해 사용합니다.
+
+SESSION_COOKIE = "JSESSIONID=mock-session"
+NOTICES_PER_DAY = 30
+AGENCIES = ["서울특별시", "부산광역시", "한국도로공사", "국가철도공단", "경기도교육청"]
+BID_METHODS = ["전자입찰", "수의계약", "제한경쟁"]
+
+
+# 날짜별 가상 공고 생성 (같은 날짜는 항상 같은 결과)
+def build_notices(date_str):
+    rng = random.Random(date_str)
+    day = datetime.strptime(date_str, "%Y%m%d")
+    notices = []
+    for n in range(NOTICES_PER_DAY):
+        posted = day + timedelta(minutes=rng.randint(0, 24 * 60 - 1))
+        notices.append({
+            "bidPbancNum": f"R{date_str[2:]}BK{n:05d}",
+            "bidPbancOrd": "000",
+            "bidPbancNm": f"{rng.choice(AGENCIES)} 시설물 유지보수 용역 {n + 1}차",
+            "pbancInstNm": rng.choice(AGENCIES),
+            "dmndInstNm": rng.choice(AGENCIES),
+            "bidMthdNm": rng.choice(BID_METHODS),
+            "presmptPrce": str(rng.randint(1, 5000) * 10000),
+            "pbancPstgDt": posted.strftime("%Y%m%d%H%M")
+        })
+    return notices
+
+def search_notices(start_date, end_date):
+    start = datetime.strptime(start_date, "%Y%m%d")
+    end = datetime.strptime(end_date, "%Y%m%d")
+    notices = []
+    day = start
+    while day <= end:
+        notices.extend(build_notices(day.strftime("%Y%m%d")))
+        day += timedelta(days=1)
+    # 최신 게시순 정렬
+    notices.sort(key=lambda x: x["pbancPstgDt"], reverse=True)
+    return notices
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        # 알림 웹훅 수신 (세션 불필요)
+        if self.path == "/webhook":
+            alert = self._read_json()
+            print(f"[WEBHOOK] {alert.get('rules')} {alert.get('id')} {alert.get('title')}")
+            self._send_json(200, {"ok": True})
+            return
+
+        if self.path.startswith("/api/") and SESSION_COOKIE not in (self.headers.get("Cookie") or ""):
+            self._send_json(401, {"error": "session expired"})
+            return
+
+        body = self._read_json()
+        param = body.get("dlParamM", {})
+
+        if self.path == "/api/list":
+            notices = search_notices(
+                param.get("pbancPstgStDt", "").replace("/", ""),
+                param.get("pbancPstgEdDt", "").replace("/", "")
+            )
+            page_size = int(param.get("recordCountPerPage", 10))
+            page_index = int(param.get("pageIndex", 1))
+            offset = (page_index - 1) * page_size
+            rows = [
+                {key: n[key] for key in ("bidPbancNum", "bidPbancOrd", "bidPbancNm", "pbancPstgDt")}
+                for n in notices[offset:offset + page_size]
+            ]
+            self._send_json(200, {"dlBidPbancList": rows, "totCnt": len(notices)})
+
+        elif self.path == "/api/detail":
+            notice_id = param.get("bidPbancNum", "")
+            date_str = "20" + notice_id[1:7]
+            try:
+                notice = next(n for n in build_notices(date_str) if n["bidPbancNum"] == notice_id)
+            except (StopIteration, ValueError):
+                self._send_json(404, {"error": "not found"})
+                return
+            files = [
+                {"orgnlAtchFileNm": f"{notice_id}_공고문.hwp", "atchFileSz": "102400"},
+                {"orgnlAtchFileNm": f"{notice_id}_과업지시서.pdf", "atchFileSz": "204800"}
+            ]
+            self._send_json(200, {"dmBidPbancInfo": notice, "dlAtchFileList": files})
+
+        else:
+            self._send_json(404, {"error": "unknown endpoint"})
+
+
+# 테스트 서버에 맞는 API 엔진 프로파일 생성
+def build_profile(base_url):
+    return {
+        "created_at": datetime.now().isoformat(),
+        "headers": {"Content-Type": "application/json"},
+        "storage_state": {
+            "cookies": [{
+                "name": "JSESSIONID", "value": "mock-session", "domain": "127.0.0.1", "path": "/",
+                "expires": -1, "httpOnly": False, "secure": False, "sameSite": "Lax"
+            }],
+            "origins": []
+        },
+        "list": {
+            "url": f"{base_url}/api/list",
+            "body": {"dlParamM": {"pbancPstgStDt": "2026/01/01", "pbancPstgEdDt": "2026/01/01", "pageIndex": 1, "recordCountPerPage": 100}},
+            "rows_path": ["dlBidPbancList"],
+            "page_path": ["dlParamM", "pageIndex"],
+            "date_paths": {"start": ["dlParamM", "pbancPstgStDt"], "end": ["dlParamM", "pbancPstgEdDt"]},
+            "date_key": "pbancPstgDt"
+        },
+        "details": [{
+            "url": f"{base_url}/api/detail",
+            "body": {"dlParamM": {"bidPbancNum": "", "bidPbancOrd": ""}},
+            "bindings": [
+                {"path": ["dlParamM", "bidPbancNum"], "key": "bidPbancNum"},
+                {"path": ["dlParamM", "bidPbancOrd"], "key": "bidPbancOrd"}
+            ]
+        }],
+        "fields": {
+            "공고일반": {
+                "입찰공고번호": {"source": 0, "path": ["dmBidPbancInfo", "bidPbancNum"], "format": "raw"},
+                "공고명": {"source": 0, "path": ["dmBidPbancInfo", "bidPbancNm"], "format": "raw"},
+                "공고기관": {"source": 0, "path": ["dmBidPbancInfo", "pbancInstNm"], "format": "raw"},
+                "수요기관": {"source": 0, "path": ["dmBidPbancInfo", "dmndInstNm"], "format": "raw"},
+                "입찰방식": {"source": 0, "path": ["dmBidPbancInfo", "bidMthdNm"], "format": "raw"},
+                "게시일시": {"source": 0, "path": ["dmBidPbancInfo", "pbancPstgDt"], "format": "datetime"},
+                "추정가격": {"source": 0, "path": ["dmBidPbancInfo", "presmptPrce"], "format": "money"}
+            }
+        },
+        "grids": {
+            "__files__": {
+                "source": 0,
+                "path": ["dlAtchFileList"],
+                "columns": {
+                    "파일명": {"key": "orgnlAtchFileNm", "format": "raw"},
+                    "파일크기": {"key": "atchFileSz", "format": "raw"}
+                }
+            }
+        }
+    }
+
+
+if __name__ == "__main__":
+    # 예) python mock_server.py --port 8080 --write-profile data/mock_profile.json
+    #     python main.py --mode history --start 20260201 --end 20260202 --engine api --api-profile data/mock_profile.json
+    parser = argparse.ArgumentParser(description="누리장터 API 테스트 서버")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--write-profile", type=str, help="Write an API engine profile for this server")
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    if args.write_profile:
+        with open(args.write_profile, "w", encoding="utf-8") as f:
+            json.dump(build_profile(base_url), f, ensure_ascii=False, indent=2)
+        print(f"[INFO] Profile written: {args.write_profile}")
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), MockHandler)
+    print(f"[INFO] Mock server running at {base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,180 @@
+import os
+import sqlite3
+from src.exporter import iter_records, record_date, count_lines
+from src.normalize import get_typed
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 대시보드용 요약 통계 (저장 시점에 증분 갱신)
+# 전체 데이터 대신 작은 집계 테이블만 읽으면 되므로 데이터 양과 관계없이 대시보드 갱신 비용이 일정합니다.
+# 카운터는 SQLite에서 "n = n + 1" 형태로 증가시키므로 여러 컨테이너가 동시에 저장해도 값이 덮어써지지 않으며,
+# 시작 시 JSONL 건수와 맞지 않으면(저장 도중 중단 등) JSONL로 다시 집계합니다.
+
+# 추정가격 구간 (상한, 라벨)
+PRICE_BUCKETS = [
+    (10_000_000, "1천만 미만"),
+    (50_000_000, "1천만~5천만"),
+    (100_000_000, "5천만~1억"),
+    (500_000_000, "1억~5억"),
+    (1_000_000_000, "5억~10억"),
+    (None, "10억 이상")
+]
+
+AGENCY_KEYS = ["공고기관", "수요기관"]
+BID_METHOD_KEYS = ["입찰방식", "입찰방법"]
+PRICE_KEYS = ["추정가격", "배정예산", "기초금액"]
+
+
+# 집계 대상 지표 (dashboard에서 읽는 키)
+COUNTER_METRICS = ("per_day", "per_agency", "bid_method", "price_buckets")
+
+
+def _connect(db_path):
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+# 공고일반 섹션에서 후보 키 중 처음 발견되는 값
+def _find_value(general, keys):
+    for key in keys:
+        for label, value in general.items():
+            if key in label and value:
+                return value
+    return None
+
+def _price_bucket(amount):
+    for upper, label in PRICE_BUCKETS:
+        if upper is None or amount < upper:
+            return label
+
+# 공고 1건의 (지표, 키, 증가량) 목록
+def _increments(record):
+    increments = [("total", "", 1)]
+
+    day = record_date(record)
+    if day:
+        increments.append(("per_day", f"{day[:4]}-{day[4:6]}-{day[6:8]}", 1))
+
+    general = record.get("sections", {}).get("공고일반", {})
+    if not isinstance(general, dict):
+        general = {}
+
+    agency = _find_value(general, AGENCY_KEYS)
+    if agency:
+        increments.append(("per_agency", agency, 1))
+
+    method = _find_value(general, BID_METHOD_KEYS)
+    if method:
+        increments.append(("bid_method", method, 1))
+
+    # 추정가격은 정규화 단계에서 변환된 정수 사용
+    amount = _find_value(get_typed(record).get("공고일반", {}), PRICE_KEYS)
+    if amount:
+        increments.append(("price_buckets", _price_bucket(amount), 1))
+        increments.append(("price_sum", "", amount))
+        increments.append(("price_count", "", 1))
+    return increments
+
+
+class AggregateStore:
+    def __init__(self, save_dir="data"):
+        self.db_path = os.path.join(save_dir, "aggregates.db")
+        self.conn = _connect(self.db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS counters (
+                metric TEXT NOT NULL,
+                key TEXT NOT NULL,
+                n INTEGER NOT NULL,
+                PRIMARY KEY (metric, key)
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value
+            );
+        """)
+
+    def _apply(self, record):
+        self.conn.executemany(
+            "INSERT INTO counters (metric, key, n) VALUES (?, ?, ?) "
+            "ON CONFLICT (metric, key) DO UPDATE SET n = n + excluded.n",
+            _increments(record)
+        )
+        crawled_at = record.get("crawled_at")
+        if crawled_at:
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('last_crawled_at', ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = max(value, excluded.value)",
+                (crawled_at,)
+            )
+
+    # 집계 건수가 JSONL 건수와 다르면 (최초 실행, 저장 도중 중단 등) JSONL로 다시 집계
+    def ensure_built(self, jsonl_path):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            total = self.conn.execute("SELECT n FROM counters WHERE metric = 'total'").fetchone()
+            skipped = self.conn.execute("SELECT value FROM meta WHERE key = 'skipped_lines'").fetchone()
+            lines = count_lines(jsonl_path)
+            if (total[0] if total else 0) + (skipped[0] if skipped else 0) == lines:
+                self.conn.execute("COMMIT")
+                return
+
+            self.conn.execute("DELETE FROM counters")
+            self.conn.execute("DELETE FROM meta")
+            count = 0
+            for item in iter_records(jsonl_path):
+                self._apply(item)
+                count += 1
+            # 읽을 수 없는 줄은 건수 비교에서 제외
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('skipped_lines', ?)", (lines - count,))
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        if count:
+            logger.info("Aggregates rebuilt from %d records.", count)
+
+    # 공고 1건 반영
+    def update(self, record):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._apply(record)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        self.conn.close()
+
+
+# 대시보드에서 읽기 전용으로 사용
+def load_aggregates(save_dir="data"):
+    db_path = os.path.join(save_dir, "aggregates.db")
+    if not os.path.exists(db_path):
+        return None
+    try:
+        conn = _connect(db_path)
+        try:
+            counters = conn.execute("SELECT metric, key, n FROM counters").fetchall()
+            last = conn.execute("SELECT value FROM meta WHERE key = 'last_crawled_at'").fetchone()
+        finally:
+            conn.close()
+    except Exception:
+        return None
+
+    stats = {
+        "total": 0,
+        "last_crawled_at": last[0] if last else None,
+        "price_sum": 0,
+        "price_count": 0
+    }
+    stats.update({metric: {} for metric in COUNTER_METRICS})
+    stats["price_buckets"] = {label: 0 for _, label in PRICE_BUCKETS}
+    for metric, key, n in counters:
+        if metric in COUNTER_METRICS:
+            stats[metric][key] = n
+        else:
+            stats[metric] = n
+    return stats
@@ -0,0 +1,208 @@
+import os
+import json
+import queue
+import threading
+import urllib.request
+from collections import deque
+from datetime import datetime
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 신규 공고 키워드/기관 알림
+# 모든 규칙의 키워드를 하나의 Aho-Corasick 오토마톤으로 합쳐 공고 1건을 한 번만 훑어 검사하고,
+# 매칭 결과는 백그라운드 스레드가 파일/웹훅으로 전달하므로 수집 속도에 영향을 주지 않습니다.
+
+# 필드 경계를 넘는 매칭 방지용 구분자
+FIELD_SEPARATOR = "\x00"
+
+
+class AhoCorasick:
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [set()]
+
+    def add(self, pattern, value):
+        if not pattern:
+            return
+        state = 0
+        for ch in pattern:
+            if ch not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(set())
+                self.goto[state][ch] = len(self.goto) - 1
+            state = self.goto[state][ch]
+        self.output[state].add(value)
+
+    # 실패 링크 구성 (BFS)
+    def build(self):
+        pending = deque()
+        for state in self.goto[0].values():
+            self.fail[state] = 0
+            pending.append(state)
+
+        while pending:
+            current = pending.popleft()
+            for ch, nxt in self.goto[current].items():
+                pending.append(nxt)
+                state = self.fail[current]
+                while state and ch not in self.goto[state]:
+                    state = self.fail[state]
+                self.fail[nxt] = self.goto[state].get(ch, 0)
+                self.output[nxt] |= self.output[self.fail[nxt]]
+        return self
+
+    # 텍스트에 등장하는 모든 패턴의 값 집합
+    def find(self, text):
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(ch, 0)
+            if self.output[state]:
+                found |= self.output[state]
+        return found
+
+
+class FileSink:
+    def __init__(self, path="data/alerts.jsonl"):
+        self.path = path
+        alert_dir = os.path.dirname(self.path)
+        if alert_dir and not os.path.exists(alert_dir):
+            os.makedirs(alert_dir)
+
+    def send(self, alert):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(alert, ensure_ascii=False) + "\n")
+
+class WebhookSink:
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, alert):
+        body = json.dumps(alert, ensure_ascii=False).encode("utf-8")
+        request = urllib.request.Request(
+            self.url, data=body, headers={"Content-Type": "application/json; charset=utf-8"}, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+SINK_TYPES = {
+    "file": FileSink,
+    "webhook": WebhookSink
+}
+
+
+def _general_fields(record):
+    general = record.get("sections", {}).get("공고일반", {})
+    return general if isinstance(general, dict) else {}
+
+def _file_names(record):
+    names = []
+    for f in record.get("files", []):
+        name = f.get("파일명") or f.get("orgnlAtchFileNm")
+        if name:
+            names.append(name)
+    return names
+
+
+class AlertEngine:
+    def __init__(self, rules, sinks):
+        self.rules = {rule["name"]: rule for rule in rules}
+        self.sinks = sinks
+
+        # 키워드: 공고명, 공고일반 값, 첨부파일명 대상 / 기관: 공고일반의 *기관 필드 대상
+        self.keyword_matcher = AhoCorasick()
+        self.agency_matcher = AhoCorasick()
+        for rule in rules:
+            for keyword in rule.get("keywords", []):
+                self.keyword_matcher.add(keyword, rule["name"])
+            for agency in rule.get("agencies", []):
+                self.agency_matcher.add(agency, rule["name"])
+        self.keyword_matcher.build()
+        self.agency_matcher.build()
+
+        self.queue = queue.Queue()
+        self.sent = 0
+        self._thread = threading.Thread(target=self._run, name="alert-dispatcher", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_file(cls, rules_path):
+        with open(rules_path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        sinks = []
+        for sink in config.get("sinks", [{"type": "file"}]):
+            options = {key: value for key, value in sink.items() if key != "type"}
+            sinks.append(SINK_TYPES[sink["type"]](**options))
+        return cls(config.get("rules", []), sinks)
+
+    # 공고 1건에 해당하는 규칙 이름 목록
+    def match(self, record):
+        general = _general_fields(record)
+
+        texts = [record.get("title") or ""]
+        texts.extend(str(value) for value in general.values())
+        texts.extend(_file_names(record))
+        keyword_hits = self.keyword_matcher.find(FIELD_SEPARATOR.join(texts))
+
+        agencies = [str(value) for key, value in general.items() if "기관" in key]
+        agency_hits = self.agency_matcher.find(FIELD_SEPARATOR.join(agencies))
+
+        matched = []
+        for name, rule in self.rules.items():
+            has_keywords = bool(rule.get("keywords"))
+            has_agencies = bool(rule.get("agencies"))
+            if not (has_keywords or has_agencies):
+                continue
+            # 지정된 조건을 모두 만족해야 알림
+            if has_keywords and name not in keyword_hits:
+                continue
+            if has_agencies and name not in agency_hits:
+                continue
+            matched.append(name)
+        return matched
+
+    # 저장 경로에서 호출 (큐에 넣기만 하고 즉시 반환)
+    def submit(self, record):
+        self.queue.put(record)
+
+    def _run(self):
+        while True:
+            record = self.queue.get()
+            try:
+                if record is None:
+                    return
+                rules = self.match(record)
+                if rules:
+                    self._dispatch(record, rules)
+            except Exception as e:
+                logger.warning("Alert evaluation failed: %s", e, extra={"notice_id": record.get("id") if record else None})
+            finally:
+                self.queue.task_done()
+
+    def _dispatch(self, record, rules):
+        alert = {
+            "rules": rules,
+            "id": record.get("id"),
+            "title": record.get("title"),
+            "agency": next((v for k, v in _general_fields(record).items() if "기관" in k and v), None),
+            "crawled_at": record.get("crawled_at"),
+            "alerted_at": datetime.now().isoformat()
+        }
+        for sink in self.sinks:
+            try:
+                sink.send(alert)
+            except Exception as e:
+                logger.warning("Alert sink %s failed: %s", type(sink).__name__, e, extra={"notice_id": alert["id"]})
+        self.sent += 1
+        logger.info("Alert sent (%s)", ", ".join(rules), extra={"notice_id": alert["id"], "phase": "alert"})
+
+    # 종료 시 남은 알림 처리
+    def close(self, timeout=10):
+        self.queue.put(None)
+        self._thread.join(timeout)
@@ -0,0 +1,695 @@
+import asyncio
+import copy
+import json
+import os
+import re
+from datetime import datetime
+from src.crawler import NuriCrawler, retry_action, parse_cutoff, is_before_cutoff, needs_boundary_search
+from src.governor import RateGovernor
+from src.utils import clean_text
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 목록/상세 응답이 예상한 구조와 다를 때
+class ApiSchemaError(Exception):
+    pass
+
+# 세션 만료 등으로 API 호출이 거부될 때
+class ApiAuthError(Exception):
+    pass
+
+# 목록 요청 본문에서 페이지 번호를 담는 키
+PAGE_KEY_PATTERN = re.compile(r"(?i)^(page(index|no|num)|curpage|currentpage)$")
+DATE_PATTERN = re.compile(r"(\d{4})[/-]?(\d{2})[/-]?(\d{2})")
+FORMATS = ["raw", "money", "datetime", "date"]
+# 요청 헤더 중 재사용하지 않을 항목
+SKIP_HEADERS = {"cookie", "content-length", "host", "connection", "accept-encoding"}
+
+
+# JSON 트리의 모든 말단 값을 (경로, 값) 형태로 순회
+def _walk(node, path=()):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from _walk(value, path + (key,))
+    elif isinstance(node, list):
+        for idx, value in enumerate(node):
+            yield from _walk(value, path + (idx,))
+    else:
+        yield path, node
+
+def _get_path(node, path):
+    for key in path:
+        try:
+            node = node[key]
+        except (KeyError, IndexError, TypeError):
+            raise ApiSchemaError(f"Missing path in response: {list(path)}")
+    return node
+
+def _set_path(node, path, value):
+    for key in path[:-1]:
+        node = node[key]
+    node[path[-1]] = value
+
+# 특정 키를 가진 dict 리스트의 경로 탐색
+def _find_row_lists(node, path=()):
+    if isinstance(node, list):
+        if node and all(isinstance(item, dict) for item in node):
+            yield path, node
+        for idx, value in enumerate(node):
+            yield from _find_row_lists(value, path + (idx,))
+    elif isinstance(node, dict):
+        for key, value in node.items():
+            yield from _find_row_lists(value, path + (key,))
+
+def _digits(text):
+    return re.sub(r"\D", "", str(text))
+
+# API 원본 값을 화면 표시 형식으로 변환
+def _format_value(raw, fmt):
+    if raw is None:
+        return ""
+    text = str(raw)
+    digits = _digits(text)
+
+    if fmt == "money":
+        if not digits or digits != text.replace(",", "").strip():
+            return None
+        return f"{int(digits):,} 원"
+    if fmt == "datetime":
+        if len(digits) < 12:
+            return None
+        return f"{digits[0:4]}/{digits[4:6]}/{digits[6:8]} {digits[8:10]}:{digits[10:12]}"
+    if fmt == "date":
+        if len(digits) != 8:
+            return None
+        return f"{digits[0:4]}/{digits[4:6]}/{digits[6:8]}"
+    return clean_text(text)
+
+def _detect_format(raw, dom_value):
+    if isinstance(raw, (dict, list)):
+        return None
+    for fmt in FORMATS:
+        if _format_value(raw, fmt) == dom_value:
+            return fmt
+    return None
+
+# 기존 값의 숫자 자리만 새 날짜로 교체 (구분자 형식 유지)
+def _replace_date(old_value, new_date):
+    chars = list(str(old_value))
+    digits = iter(new_date)
+    for idx, ch in enumerate(chars):
+        if ch.isdigit():
+            chars[idx] = next(digits, ch)
+    return "".join(chars)
+
+
+# 브라우저 없는 API 수집 엔진 (NuriCrawler와 동일한 인터페이스)
+# 브라우저는 세션 준비와 API 호출 구조 학습에만 한 번 사용하고,
+# 스키마/인증 오류 발생 시 Playwright 엔진으로 전환
+class NuriApiCrawler:
+    def __init__(self, headless=True, concurrency=8, profile_path=None, governor=None, watchdog=None, diagnostics=None):
+        self.headless = headless
+        self.watchdog = watchdog
+        self.diagnostics = diagnostics
+        self.governor = governor or RateGovernor()
+        self.concurrency = concurrency
+        self.profile_path = profile_path
+
+        self.browser_crawler = None
+        self.playwright = None
+        self.api = None
+        self.profile = None
+
+        self.start_date = None
+        self.end_date = None
+        # 부트스트랩 실패 시 Playwright 엔진으로 전체 위임
+        self.use_browser = False
+        self._failed_notices = 0
+
+    async def start_browser(self):
+        self.browser_crawler = NuriCrawler(
+            headless=self.headless, governor=self.governor, watchdog=self.watchdog, diagnostics=self.diagnostics
+        )
+
+        # 저장된 프로파일이 있으면 브라우저 없이 시작
+        if self.profile_path and os.path.exists(self.profile_path):
+            try:
+                with open(self.profile_path, "r", encoding="utf-8") as f:
+                    self.profile = json.load(f)
+                logger.info("API profile loaded: %s", self.profile_path)
+                return
+            except Exception as e:
+                logger.warning("API profile load failed: %s", e)
+                self.profile = None
+
+        await self.browser_crawler.start_browser()
+        self.playwright = self.browser_crawler.playwright
+
+    async def close_browser(self):
+        if self.api:
+            try:
+                await self.api.dispose()
+            except Exception:
+                pass
+            self.api = None
+        if self.browser_crawler:
+            await self.browser_crawler.close_browser()
+            # 폴백 시 별도로 시작된 Playwright 인스턴스 정리
+            fallback_playwright = self.browser_crawler.playwright
+            if fallback_playwright and fallback_playwright is not self.playwright:
+                try:
+                    await fallback_playwright.stop()
+                except Exception:
+                    pass
+        if self.playwright:
+            try:
+                await self.playwright.stop()
+            except Exception:
+                pass
+            self.playwright = None
+
+    # 프로파일의 쿠키/헤더로 HTTP 클라이언트 생성
+    async def _open_api_context(self):
+        if self.playwright is None:
+            from playwright.async_api import async_playwright
+            self.playwright = await async_playwright().start()
+
+        if self.api:
+            await self.api.dispose()
+
+        self.api = await self.playwright.request.new_context(
+            extra_http_headers=self.profile.get("headers", {}),
+            storage_state=self.profile.get("storage_state")
+        )
+
+    def _save_profile(self):
+        if not self.profile_path:
+            return
+        try:
+            profile_dir = os.path.dirname(self.profile_path)
+            if profile_dir and not os.path.exists(profile_dir):
+                os.makedirs(profile_dir)
+            with open(self.profile_path, "w", encoding="utf-8") as f:
+                json.dump(self.profile, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.warning("API profile save failed: %s", e)
+
+    # 브라우저로 검색 및 상세 조회를 한 번 수행하며 API 호출 구조를 학습
+    async def _bootstrap(self, start_date, end_date):
+        # 만료된 프로파일로 열었던 HTTP 클라이언트 정리
+        if self.api:
+            await self.api.dispose()
+            self.api = None
+        if self.playwright and self.playwright is not self.browser_crawler.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+        if self.browser_crawler.browser is None:
+            await self.browser_crawler.start_browser()
+            self.playwright = self.browser_crawler.playwright
+
+        page = self.browser_crawler.page
+        captured = []
+        page.on("response", lambda response: captured.append(response))
+
+        if not await self.browser_crawler.search_period(start_date, end_date):
+            raise ApiSchemaError("Browser search failed during bootstrap.")
+
+        # 1. 목록 API 탐색
+        list_spec = None
+        for response in reversed(captured):
+            request = response.request
+            if request.method != "POST":
+                continue
+            try:
+                body = request.post_data_json
+                payload = await response.json()
+            except Exception:
+                continue
+            for rows_path, rows in _find_row_lists(payload):
+                if "bidPbancNum" in rows[0]:
+                    list_spec = {
+                        "url": response.url,
+                        "body": body,
+                        "rows_path": list(rows_path),
+                        "sample_row": rows[0],
+                        "headers": await request.all_headers()
+                    }
+                    break
+            if list_spec:
+                break
+
+        if not list_spec:
+            raise ApiSchemaError("List API call not found.")
+
+        page_path = None
+        date_paths = {}
+        for path, value in _walk(list_spec["body"]):
+            if path and isinstance(path[-1], str) and PAGE_KEY_PATTERN.match(path[-1]):
+                page_path = list(path)
+            elif isinstance(value, str) and _digits(value) == start_date and "start" not in date_paths:
+                date_paths["start"] = list(path)
+            elif isinstance(value, str) and _digits(value) == end_date:
+                date_paths["end"] = list(path)
+
+        if page_path is None:
+            raise ApiSchemaError("Page index field not found in list request.")
+
+        sample_row = list_spec["sample_row"]
+        notice_id = str(sample_row["bidPbancNum"])
+
+        # 목록 행의 게시일자 키 (컷오프 검사용)
+        row_text = await page.locator("tr.grid_body_row").first.inner_text()
+        date_match = DATE_PATTERN.search(row_text)
+        date_key = None
+        if date_match:
+            target = "".join(date_match.groups())
+            for key, value in sample_row.items():
+                if isinstance(value, str) and _digits(value).startswith(target):
+                    date_key = key
+                    break
+
+        # 2. 상세 API 탐색
+        captured.clear()
+        title_link = page.locator("tr.grid_body_row").first.locator("td[col_id='bidPbancNm'] a")
+        await title_link.click()
+        await page.wait_for_selector("td[data-title='입찰공고번호']", timeout=15000)
+        dom_record = await self.browser_crawler.extract_detail_info()
+
+        details = []
+        payloads = []
+        for response in captured:
+            request = response.request
+            if request.method != "POST" or notice_id not in (request.post_data or ""):
+                continue
+            try:
+                body = request.post_data_json
+                payload = await response.json()
+            except Exception:
+                continue
+
+            # 요청 본문 중 목록 행 값에서 채워지는 위치
+            bindings = []
+            for path, value in _walk(body):
+                for key, row_value in sample_row.items():
+                    if value is not None and str(value) == str(row_value) and str(value):
+                        bindings.append({"path": list(path), "key": key})
+                        break
+            details.append({"url": response.url, "body": body, "bindings": bindings})
+            payloads.append(payload)
+
+        if not details:
+            raise ApiSchemaError("Detail API call not found.")
+
+        # 화면 레코드와 같은 형태를 보장할 수 없으면 API 엔진을 사용하지 않음
+        fields, grids, unmapped = self._learn_mapping(dom_record, payloads)
+        if unmapped:
+            raise ApiSchemaError(f"Detail labels not found in API responses: {', '.join(unmapped)}")
+
+        headers = {
+            key: value for key, value in list_spec.pop("headers").items()
+            if key.lower() not in SKIP_HEADERS and not key.startswith(":")
+        }
+        list_spec.pop("sample_row")
+        list_spec.update({"page_path": page_path, "date_paths": date_paths, "date_key": date_key})
+
+        self.profile = {
+            "created_at": datetime.now().isoformat(),
+            "headers": headers,
+            "storage_state": await self.browser_crawler.context.storage_state(),
+            "list": list_spec,
+            "details": details,
+            "fields": fields,
+            "grids": grids
+        }
+        self._save_profile()
+        logger.info("API bootstrap done (%d labels mapped). Closing browser.",
+                    sum(len(labels) for labels in fields.values()) + len(grids), extra={"phase": "bootstrap"})
+
+        # 세션 정보 확보 후 브라우저 종료
+        await self.browser_crawler.close_browser()
+        self.browser_crawler.browser = None
+
+    # 화면에서 추출한 값과 API 응답 값을 비교하여 라벨 -> JSON 경로 매핑 생성
+    # 공고기관/수요기관처럼 값이 같은 항목이 하나의 경로를 공유하지 않도록 후보가 적은 라벨부터
+    # 아직 배정되지 않은 경로를 배정하며, 값이 있는데 경로를 찾지 못한 라벨 목록을 함께 반환
+    def _learn_mapping(self, dom_record, payloads):
+        fields = {}
+        grids = {}
+        unmapped = []
+        empty = []
+
+        leaves = [
+            (idx, list(path), value)
+            for idx, payload in enumerate(payloads)
+            for path, value in _walk(payload)
+        ]
+
+        candidates = []
+        for section_name, section_data in dom_record.get("sections", {}).items():
+            if isinstance(section_data, dict):
+                for label, dom_value in section_data.items():
+                    # 화면과 같은 항목 순서를 유지하도록 자리를 먼저 만듦
+                    fields.setdefault(section_name, {})[label] = {"source": None}
+                    if not dom_value:
+                        # 샘플 공고에서 비어 있는 항목은 경로를 알 수 없으므로 빈 값으로 유지 (레코드 형태는 동일)
+                        empty.append(f"{section_name}.{label}")
+                        continue
+                    matches = []
+                    for idx, path, raw in leaves:
+                        fmt = _detect_format(raw, dom_value)
+                        if fmt:
+                            matches.append({"source": idx, "path": path, "format": fmt})
+                    candidates.append((section_name, label, matches))
+
+        assigned = set()
+        for section_name, label, matches in sorted(candidates, key=lambda c: len(c[2])):
+            match = next((m for m in matches if (m["source"], tuple(m["path"])) not in assigned), None)
+            if match is None:
+                unmapped.append(f"{section_name}.{label}")
+                continue
+            assigned.add((match["source"], tuple(match["path"])))
+            fields[section_name][label] = match
+
+        grid_sections = {
+            name: rows for name, rows in dom_record.get("sections", {}).items() if isinstance(rows, list)
+        }
+        grid_sections["__files__"] = dom_record.get("files", [])
+
+        for section_name, dom_rows in grid_sections.items():
+            if not dom_rows:
+                continue
+            first_row = dom_rows[0]
+            best = None
+            for idx, payload in enumerate(payloads):
+                for rows_path, rows in _find_row_lists(payload):
+                    columns = {}
+                    for label, dom_value in first_row.items():
+                        for key, raw in rows[0].items():
+                            if any(col["key"] == key for col in columns.values()):
+                                continue
+                            fmt = _detect_format(raw, dom_value) if dom_value else None
+                            if fmt:
+                                columns[label] = {"key": key, "format": fmt}
+                                break
+                    if len(columns) * 2 >= len(first_row) and (best is None or len(columns) > len(best["columns"])):
+                        best = {"source": idx, "path": list(rows_path), "columns": columns}
+            if best is None:
+                unmapped.append(section_name)
+                continue
+            grids[section_name] = best
+            unmapped.extend(
+                f"{section_name}.{label}" for label, dom_value in first_row.items()
+                if dom_value and label not in best["columns"]
+            )
+
+        if empty:
+            logger.warning("Labels empty in the sample notice are recorded as empty by the API engine: %s",
+                           ", ".join(empty), extra={"phase": "bootstrap"})
+        return fields, grids, unmapped
+
+    # 목록 요청 본문 생성
+    def _build_list_body(self, page_num):
+        spec = self.profile["list"]
+        body = copy.deepcopy(spec["body"])
+        _set_path(body, spec["page_path"], page_num)
+        date_paths = spec.get("date_paths", {})
+        if self.start_date and "start" in date_paths:
+            _set_path(body, date_paths["start"], _replace_date(_get_path(body, date_paths["start"]), self.start_date))
+        if self.end_date and "end" in date_paths:
+            _set_path(body, date_paths["end"], _replace_date(_get_path(body, date_paths["end"]), self.end_date))
+        return body
+
+    async def _post_json(self, url, body):
+        async with self.governor.track():
+            response = await self.api.post(url, data=body)
+            # 차단/과부하 응답은 속도 감소 대상
+            if response.status in (429, 503):
+                raise Exception(f"HTTP {response.status} from {url}")
+        if response.status in (401, 403):
+            raise ApiAuthError(f"HTTP {response.status} from {url}")
+        if not response.ok:
+            raise Exception(f"HTTP {response.status} from {url}")
+        try:
+            return await response.json()
+        except Exception:
+            # 세션 만료 시 로그인/메인 HTML이 반환됨
+            raise ApiAuthError(f"Non-JSON response from {url}")
+
+    @retry_action(max_retries=3, delay=2, no_retry=(ApiAuthError, ApiSchemaError))
+    async def _fetch_list(self, page_num):
+        spec = self.profile["list"]
+        payload = await self._post_json(spec["url"], self._build_list_body(page_num))
+        rows = _get_path(payload, spec["rows_path"])
+        if not isinstance(rows, list):
+            raise ApiSchemaError("List rows are not a list.")
+        if rows and "bidPbancNum" not in rows[0]:
+            raise ApiSchemaError("List rows have no bidPbancNum.")
+        return rows
+
+    @retry_action(max_retries=3, delay=2, no_retry=(ApiAuthError, ApiSchemaError))
+    async def _fetch_detail(self, row):
+        payloads = []
+        for spec in self.profile["details"]:
+            body = copy.deepcopy(spec["body"])
+            for binding in spec["bindings"]:
+                if binding["key"] not in row:
+                    raise ApiSchemaError(f"List row has no '{binding['key']}'.")
+                _set_path(body, binding["path"], row[binding["key"]])
+            payloads.append(await self._post_json(spec["url"], body))
+
+        record = {"sections": {}, "files": []}
+        mapped = missing = 0
+        for section_name, labels in self.profile["fields"].items():
+            section = {}
+            for label, source in labels.items():
+                if source["source"] is None:
+                    section[label] = ""
+                    continue
+                mapped += 1
+                try:
+                    raw = _get_path(payloads[source["source"]], source["path"])
+                except ApiSchemaError:
+                    # 공고에 따라 선택 항목이 응답에서 빠질 수 있음 (그리드와 동일하게 빈 값 처리)
+                    raw = None
+                    missing += 1
+                section[label] = _format_value(raw, source["format"]) or ""
+            record["sections"][section_name] = section
+        # 모든 항목이 빠졌다면 선택 항목 누락이 아니라 응답 구조 변경
+        if mapped and missing == mapped:
+            raise ApiSchemaError("No mapped detail field found in API responses.")
+
+        for section_name, grid in self.profile["grids"].items():
+            try:
+                rows = _get_path(payloads[grid["source"]], grid["path"])
+            except ApiSchemaError:
+                # 그리드가 비어 있는 공고는 경로 자체가 없을 수 있음
+                rows = []
+            grid_rows = []
+            for api_row in rows:
+                grid_rows.append({
+                    label: _format_value(api_row.get(col["key"]), col["format"]) or ""
+                    for label, col in grid["columns"].items()
+                })
+            if section_name == "__files__":
+                record["files"] = grid_rows
+            else:
+                record["sections"][section_name] = grid_rows
+
+        return record
+
+    # 처리에 실패한 공고 수 (브라우저 엔진으로 전환한 경우 포함)
+    @property
+    def failed_notices(self):
+        browser_failed = self.browser_crawler.failed_notices if self.browser_crawler else 0
+        return self._failed_notices + browser_failed
+
+    # 목록 행의 게시일시 -> (일시, 시간 포함 여부)
+    def _row_posted(self, row):
+        date_key = self.profile["list"].get("date_key")
+        if not date_key or not row.get(date_key):
+            return None, False
+        digits = _digits(row[date_key])
+        try:
+            if len(digits) >= 12:
+                return datetime.strptime(digits[:12], "%Y%m%d%H%M"), True
+            if len(digits) >= 8:
+                return datetime.strptime(digits[:8], "%Y%m%d"), False
+        except ValueError:
+            pass
+        return None, False
+
+    # 컷오프 경계가 포함된 마지막 목록 페이지 (지수 탐색 후 이진 탐색, 첫 행 게시일시만 확인)
+    async def _find_boundary_page(self, cutoff_dt, start_page=1):
+        first_ids = {}
+
+        # 목록 조회 오류는 경계 이후로 보지 않고 그대로 전달 (빈 목록만 경계 이후로 판단)
+        async def is_past(page_num):
+            rows = await self._fetch_list(page_num)
+            if not rows:
+                return True
+            # 범위를 벗어난 페이지 번호에 마지막 페이지를 다시 돌려주는 경우 대비
+            first_id = str(rows[0]["bidPbancNum"])
+            if any(first_id == seen and num != page_num for num, seen in first_ids.items()):
+                return True
+            first_ids[page_num] = first_id
+            posted, has_time = self._row_posted(rows[0])
+            return is_before_cutoff(posted, has_time, cutoff_dt)
+
+        if await is_past(start_page):
+            return start_page
+
+        lo, step, hi = start_page, 1, None
+        while hi is None:
+            if await is_past(lo + step):
+                hi = lo + step
+            else:
+                lo += step
+                step *= 2
+
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if await is_past(mid):
+                hi = mid
+            else:
+                lo = mid
+
+        logger.info("Cutoff boundary found.", extra={"page": lo, "phase": "boundary"})
+        return lo
+
+    # 검색 조건 설정 (프로파일이 없거나 만료되었으면 브라우저로 학습)
+    async def search_period(self, start_date, end_date):
+        self.start_date = start_date
+        self.end_date = end_date
+        logger.info("API search initiated: %s ~ %s", start_date, end_date, extra={"phase": "search"})
+
+        if self.profile:
+            try:
+                await self._open_api_context()
+                await self._fetch_list(1)
+                return True
+            except Exception as e:
+                logger.warning("Saved API profile is not usable (%s). Re-learning with browser...", e)
+                self.profile = None
+
+        try:
+            await self._bootstrap(start_date, end_date)
+            await self._open_api_context()
+            return True
+        except Exception as e:
+            logger.warning("API bootstrap failed (%s). Falling back to browser engine.", e, extra={"phase": "bootstrap"})
+            self.use_browser = True
+            if self.browser_crawler.browser is None:
+                await self.browser_crawler.start_browser()
+            return await self.browser_crawler.search_period(start_date, end_date)
+
+    # Playwright 엔진으로 전환하여 지정 페이지부터 이어서 수집
+    async def _fallback_to_browser(self, save_callback, stop_on_duplicate, cutoff_date, start_page, boundary_ids):
+        logger.warning("Switching to browser engine.", extra={"page": start_page})
+        self.use_browser = True
+        if self.browser_crawler.browser is None:
+            await self.browser_crawler.start_browser()
+        if not await self.browser_crawler.search_period(self.start_date, self.end_date):
+            raise Exception("Browser search failed after switching engines.")
+        await self.browser_crawler.crawl_period_pages(
+            save_callback=save_callback,
+            stop_on_duplicate=stop_on_duplicate,
+            cutoff_date=cutoff_date,
+            start_page=start_page,
+            boundary_ids=boundary_ids
+        )
+
+    async def crawl_period_pages(self, save_callback, stop_on_duplicate=False, cutoff_date=None, start_page=1, boundary_ids=None):
+        if self.use_browser:
+            return await self.browser_crawler.crawl_period_pages(
+                save_callback=save_callback,
+                stop_on_duplicate=stop_on_duplicate,
+                cutoff_date=cutoff_date,
+                start_page=start_page,
+                boundary_ids=boundary_ids
+            )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(row):
+            async with semaphore:
+                return await self._fetch_detail(row)
+
+        current_page = start_page
+
+        # 컷오프 경계 페이지까지만 순회 (경계 이전 행은 행 단위로 건너뜀)
+        cutoff_dt = parse_cutoff(cutoff_date)
+        last_page = None
+        if needs_boundary_search(cutoff_dt, self.start_date):
+            try:
+                last_page = await self._find_boundary_page(cutoff_dt, current_page)
+            except (ApiSchemaError, ApiAuthError) as e:
+                logger.error("List API failed: %s", e, extra={"page": current_page})
+                return await self._fallback_to_browser(save_callback, stop_on_duplicate, cutoff_date, current_page, boundary_ids)
+
+        prev_first_id = None
+        while True:
+            logger.info("Processing list page (API)", extra={"page": current_page})
+            try:
+                rows = await self._fetch_list(current_page)
+            except (ApiSchemaError, ApiAuthError) as e:
+                logger.error("List API failed: %s", e, extra={"page": current_page})
+                return await self._fallback_to_browser(save_callback, stop_on_duplicate, cutoff_date, current_page, boundary_ids)
+
+            # 범위를 벗어난 페이지 번호에 마지막 페이지를 다시 돌려주는 경우 대비
+            first_id = str(rows[0]["bidPbancNum"]) if rows else None
+            if not rows or first_id == prev_first_id:
+                # 경계 탐색에서 확인한 페이지 이전에 목록이 끝나면 남은 공고가 빠지므로 실패로 처리
+                if last_page is not None and current_page <= last_page:
+                    raise Exception(f"List page {current_page} is empty before cutoff boundary page {last_page}.")
+                logger.info("Reached last page.", extra={"page": current_page})
+                break
+            prev_first_id = first_id
+
+            # 1. 처리 대상 행 선별 (목록 순서 유지)
+            targets = []
+            stop_signal = False
+            for row in rows:
+                notice_id = clean_text(str(row["bidPbancNum"]))
+                if cutoff_dt:
+                    posted, has_time = self._row_posted(row)
+                    if is_before_cutoff(posted, has_time, cutoff_dt, notice_id, boundary_ids):
+                        logger.debug("Skipping notice before cutoff", extra={"notice_id": notice_id, "page": current_page})
+                        continue
+
+                if not save_callback(None, notice_id, check_only=True):
+                    if stop_on_duplicate:
+                        logger.info("Found existing data. Stopping crawler.", extra={"notice_id": notice_id, "page": current_page})
+                        stop_signal = True
+                        break
+                    logger.debug("Skipping duplicate", extra={"notice_id": notice_id, "page": current_page})
+                    continue
+                targets.append((notice_id, row))
+
+            # 2. 상세 정보 동시 조회
+            results = await asyncio.gather(*(fetch(row) for _, row in targets), return_exceptions=True)
+
+            # 3. 목록 순서대로 저장
+            for (notice_id, row), result in zip(targets, results):
+                if isinstance(result, (ApiSchemaError, ApiAuthError)):
+                    logger.error("Detail API failed: %s", result, extra={"notice_id": notice_id, "page": current_page})
+                    return await self._fallback_to_browser(save_callback, stop_on_duplicate, cutoff_date, current_page, boundary_ids)
+                if isinstance(result, Exception):
+                    self._failed_notices += 1
+                    logger.error("Failed to process notice: %s", result, extra={"notice_id": notice_id, "page": current_page})
+                    continue
+
+                result["id"] = notice_id
+                result["title"] = clean_text(str(row.get("bidPbancNm", "")))
+                result["crawled_at"] = datetime.now().isoformat()
+                save_callback(result, notice_id, check_only=False)
+
+            if stop_signal:
+                break
+            if last_page is not None and current_page >= last_page:
+                logger.info("Reached cutoff boundary page.", extra={"page": current_page})
+                break
+            current_page += 1
+
+        self.governor.log_stats()
@@ -1,37 +1,112 @@
 import asyncio
 import re
+import time
+from contextlib import nullcontext
 from datetime import datetime
 from playwright.async_api import async_playwright, TimeoutError
 from src.utils import clean_text
+from src.governor import RateGovernor
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 목록 행의 게시일시 (시간이 없으면 날짜만)
+ROW_DATETIME_PATTERN = re.compile(r"(\d{4})/(\d{2})/(\d{2})(?:\s*(\d{2}):(\d{2}))?")
+
+# 목록 행 텍스트의 첫 일시 -> (일시, 시간 포함 여부)
+def parse_row_posted(row_text):
+    match = ROW_DATETIME_PATTERN.search(row_text or "")
+    if not match:
+        return None, False
+    has_time = match.group(4) is not None
+    parts = [int(part) for part in match.groups() if part is not None]
+    try:
+        return datetime(*parts), has_time
+    except ValueError:
+        return None, False
+
+# 컷오프 문자열 (YYYYMMDD 또는 워터마크의 YYYYMMDDHHMM)
+def parse_cutoff(cutoff_date):
+    if not cutoff_date:
+        return None
+    try:
+        return datetime.strptime(cutoff_date, "%Y%m%d%H%M" if len(cutoff_date) == 12 else "%Y%m%d")
+    except ValueError:
+        return None
+
+# 컷오프 이전 공고 여부 (시간이 없는 값은 날짜 단위로 비교, 같은 일시는 경계 공고번호로 구분)
+def is_before_cutoff(posted, has_time, cutoff_dt, notice_id=None, boundary_ids=None):
+    if posted is None or cutoff_dt is None:
+        return False
+    if not has_time:
+        return posted.date() < cutoff_dt.date()
+    if posted == cutoff_dt:
+        return bool(boundary_ids) and notice_id in boundary_ids
+    return posted < cutoff_dt
+
+# 컷오프가 검색 시작일보다 늦은 경우(워터마크)에만 경계 페이지 탐색
+# 시작일이 곧 컷오프인 history/worker 수집은 모든 행이 범위 안이므로 탐색하면 목록 끝까지 이동하게 됨
+def needs_boundary_search(cutoff_dt, search_start_date):
+    search_start = parse_cutoff(search_start_date)
+    return cutoff_dt is not None and search_start is not None and cutoff_dt > search_start
 
 # 재시도 데코레이터
-def retry_action(max_retries=3, delay=2):
+# no_retry: 다시 시도해도 결과가 같은 예외 (재시도/속도 제어기 실패 집계 없이 바로 전달)
+def retry_action(max_retries=3, delay=2, no_retry=()):
     def decorator(func):
         async def wrapper(*args, **kwargs):
             last_exception = None
             for attempt in range(max_retries):
                 try:
                     return await func(*args, **kwargs)
+                except no_retry:
+                    raise
                 except (TimeoutError, Exception) as e:
                     last_exception = e
-                    print(f"[WARN] Action failed ({func.__name__}), retrying {attempt + 1}/{max_retries}... Error: {e}")
+                    # 속도 제어기에 오류/타임아웃 반영
+                    governor = getattr(args[0], "governor", None) if args else None
+                    if governor and not getattr(e, "governor_recorded", False):
+                        await governor.record_failure_async(e)
+                    logger.warning("Action failed (%s), retrying %d/%d... Error: %s", func.__name__, attempt + 1, max_retries, e,
+                                   extra={"phase": func.__name__})
                     await asyncio.sleep(delay)
-            print(f"[ERROR] Action failed after {max_retries} attempts.")
+            logger.error("Action failed after %d attempts.", max_retries, extra={"phase": func.__name__})
             raise last_exception
         return wrapper
     return decorator
 
+# 컨텍스트 재생성 후 검색/목록 위치를 복원하지 못한 경우 (처음부터 다시 수집해도 복구되지 않으므로 재시도하지 않음)
+class ContextRestoreError(Exception):
+    pass
+
 class NuriCrawler:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, governor=None, watchdog=None, diagnostics=None):
         self.base_url = "https://nuri.g2b.go.kr/"
         self.headless = headless
+        # 모든 페이지 이동/클릭은 속도 제어기를 거침
+        self.governor = governor or RateGovernor()
+        # 장시간 수집 시 메모리 감시 (None이면 사용 안 함)
+        self.watchdog = watchdog
+        # 느린/실패 공고 진단 자료 수집 (None이면 사용 안 함)
+        self.diagnostics = diagnostics
+        # 페이지 재생성 후 검색 조건 복원용
+        self.search_dates = None
+        self.playwright = None
         self.browser = None
         self.page = None
         self.context = None
 
+        # 목록 페이지 이동 비용 측정 (이동 횟수, 소요 시간, 처리 공고 수)
+        self.paging_stats = {"turns": 0, "seconds": 0.0, "notices": 0}
+        # 처리에 실패한 공고 수 (0이 아니면 워터마크를 갱신하지 않음)
+        self.failed_notices = 0
+        # 수집 재시도 시 이어서 시작할 목록 페이지
+        self.resume_page = None
+
     async def start_browser(self):
-        print("[INFO] Starting browser...")
+        logger.info("Starting browser...")
         p = await async_playwright().start()
+        self.playwright = p
         self.browser = await p.chromium.launch(
             headless=self.headless,
             args=[
@@ -42,13 +117,19 @@ class NuriCrawler:
                 "--disable-extensions"
             ]
         )
-        
+        await self._open_context()
+
+    # 브라우저 컨텍스트와 페이지 생성
+    async def _open_context(self):
         self.context = await self.browser.new_context(
             viewport={"width": 1920, "height": 1080},
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
         self.page = await self.context.new_page()
 
+        if self.diagnostics:
+            await self.diagnostics.attach(self.context)
+
         try:
             await self.page.add_locator_handler(
                 self.page.locator("div.popup input[value='닫기']"),
@@ -57,11 +138,45 @@ class NuriCrawler:
         except Exception:
             pass
 
+    # 진단 모드에서 단계별 소요 시간 측정
+    def _phase(self, name):
+        return self.diagnostics.phase(name) if self.diagnostics else nullcontext()
+
+    # 메모리 회수를 위해 컨텍스트를 새로 만들고 검색 상태와 목록 페이지 복원
+    # 복원에 실패하면 컨텍스트를 다시 만들어 재시도하고, 끝내 실패하면 ContextRestoreError로 수집을 중단
+    async def _recycle_context(self, current_page, reason, max_attempts=3, delay=2):
+        logger.info("Recycling browser context...", extra={"reason": reason, "page": current_page})
+        if self.watchdog:
+            self.watchdog.reset()
+
+        last_error = None
+        for attempt in range(max_attempts):
+            try:
+                await self.context.close()
+            except Exception:
+                pass
+
+            try:
+                await self._open_context()
+                if not self.search_dates or not await self.search_period(*self.search_dates):
+                    raise Exception("Search restore failed after context recycle.")
+                if current_page > 1 and not await self._goto_list_page(current_page):
+                    raise Exception(f"Could not return to list page {current_page} after context recycle.")
+                logger.info("Context recycled. Resumed at list page.", extra={"page": current_page})
+                return
+            except Exception as e:
+                last_error = e
+                logger.warning("Context restore failed, retrying %d/%d... Error: %s", attempt + 1, max_attempts, e,
+                               extra={"page": current_page})
+                await asyncio.sleep(delay)
+
+        raise ContextRestoreError(f"Could not restore list page {current_page} after context recycle: {last_error}")
+
     async def close_browser(self):
         if self.browser:
             try:
                 await self.browser.close()
-                print("[INFO] Browser closed gracefully.")
+                logger.info("Browser closed gracefully.")
             except Exception:
                 pass
 
@@ -117,16 +232,200 @@ class NuriCrawler:
             await self.page.keyboard.press("Enter")
             await self.page.wait_for_timeout(500)
         except Exception as e:
-            print(f"[ERROR] Date input failed ({selector}): {e}")
+            logger.error("Date input failed (%s): %s", selector, e)
+
+    # 목록 그리드의 페이지당 행 수를 사이트가 허용하는 최대값으로 설정
+    async def _set_max_page_size(self):
+        try:
+            size_select = self.page.locator(
+                "select[id*='RecordCount'], select[id*='recordCount'], select[title*='목록 수'], select[title*='페이지당']"
+            ).locator("visible=true").first
+            if await size_select.count() == 0:
+                return None
+
+            # 숫자 옵션 중 최대값 선택
+            max_value = await size_select.evaluate("""
+                (el) => {
+                    let best = null;
+                    for (const opt of el.options) {
+                        const num = parseInt((opt.value || opt.text).replace(/[^0-9]/g, ''), 10);
+                        if (!isNaN(num) && (best === null || num > best.num)) {
+                            best = { num: num, value: opt.value };
+                        }
+                    }
+                    return best ? best.value : null;
+                }
+            """)
+            if max_value:
+                await size_select.select_option(value=max_value)
+                logger.debug("List page size set to %s", max_value)
+            return max_value
+        except Exception as e:
+            logger.warning("Page size setting failed: %s", e)
+            return None
+
+    # 현재 선택된 목록 페이지 번호
+    async def _get_current_list_page(self):
+        try:
+            selected = self.page.locator("a.w2pageList_label_selected").first
+            if await selected.count() > 0:
+                return int(clean_text(await selected.inner_text()))
+        except Exception:
+            pass
+        return None
+
+    # 목록 첫 행의 공고번호 (페이지 전환 완료 확인용)
+    async def _get_first_row_id(self):
+        try:
+            first_cell = self.page.locator("tr.grid_body_row td[col_id='bidPbancNum']").first
+            if await first_cell.count() > 0:
+                return clean_text(await first_cell.inner_text())
+        except Exception:
+            pass
+        return None
+
+    # 페이지 전환 후 목록이 갱신될 때까지 대기 (고정 대기 대신 첫 행 변경 감지)
+    async def _wait_list_changed(self, prev_first_id, timeout=10000):
+        try:
+            await self.page.wait_for_selector("#___processbar2", state="hidden", timeout=5000)
+        except:
+            pass
+
+        if prev_first_id is None:
+            return
+        try:
+            await self.page.wait_for_function(
+                """(prevId) => {
+                    const cell = document.querySelector("tr.grid_body_row td[col_id='bidPbancNum']");
+                    return cell && cell.innerText.trim() !== prevId;
+                }""",
+                arg=prev_first_id,
+                timeout=timeout
+            )
+        except Exception:
+            pass
+
+    # 목록 페이지 직접 이동 (페이지 번호 링크가 없으면 이전/다음 그룹 버튼으로 건너뜀)
+    # False는 목표 페이지가 목록에 없는 경우만 의미하며, 클릭/대기 중 오류는 호출자에게 그대로 전달
+    # (일시적인 이동 실패를 마지막 페이지나 컷오프 경계로 오인하지 않도록)
+    async def _goto_list_page(self, target_page):
+        started = time.perf_counter()
+        try:
+            await self._clear_overlays()
+
+            last_direction = None
+            label_clicked = False
+            while True:
+                # 그룹 이동 후 해당 그룹의 페이지가 바로 선택될 수 있으므로 매번 현재 페이지 확인
+                current = await self._get_current_list_page()
+                if current == target_page:
+                    return True
+
+                prev_first_id = await self._get_first_row_id()
+                num_btn = self.page.locator(f"a.w2pageList_control_label[index='{target_page}']")
+                next_group_btn = self.page.locator("#mf_wfm_container_pagelist_next_btn")
+                prev_group_btn = self.page.locator("#mf_wfm_container_pagelist_prev_btn")
+
+                if await num_btn.is_visible():
+                    # 라벨을 눌렀는데도 선택되지 않았다면 목록 갱신 실패 (다시 누르며 반복하지 않음)
+                    if label_clicked:
+                        raise Exception(f"Page {target_page} was not selected after clicking its label.")
+                    logger.debug("Jumping to page", extra={"page": target_page})
+                    async with self.governor.track():
+                        await num_btn.click()
+                        await self._wait_list_changed(prev_first_id)
+                    self.paging_stats["turns"] += 1
+                    # 반복문 처음에서 선택된 페이지를 다시 확인
+                    label_clicked = True
+                    continue
+
+                direction = "previous" if current is not None and current > target_page else "next"
+                # 방향이 바뀌면 목표 페이지를 지나친 것이므로 중단 (그룹 사이를 오가지 않도록)
+                if last_direction is not None and direction != last_direction:
+                    logger.warning("Page %d is not reachable from page %d.", target_page, current)
+                    return False
+                last_direction = direction
+
+                group_btn = prev_group_btn if direction == "previous" else next_group_btn
+                if not await group_btn.is_visible():
+                    if direction == "previous":
+                        logger.warning("Page %d is not reachable from page %d.", target_page, current)
+                    return False
+
+                logger.debug("Clicking %s group button", direction)
+                async with self.governor.track():
+                    await group_btn.click()
+                    await self._wait_list_changed(prev_first_id)
+                self.paging_stats["turns"] += 1
+
+        except Exception as e:
+            logger.error("Page jump failed: %s", e, extra={"page": target_page})
+            raise
+        finally:
+            self.paging_stats["seconds"] += time.perf_counter() - started
+
+    # 목록 첫 행의 게시일시 -> (일시, 시간 포함 여부)
+    async def _get_first_row_posted(self):
+        try:
+            first_row = self.page.locator("tr.grid_body_row").first
+            if await first_row.count() > 0:
+                return parse_row_posted(await first_row.inner_text())
+        except Exception:
+            pass
+        return None, False
+
+    # 컷오프 경계가 포함된 마지막 목록 페이지 (지수 탐색 후 이진 탐색, 첫 행 게시일시만 확인)
+    # 목록은 최신 게시순이므로 첫 행이 컷오프 이전인 페이지부터는 모두 수집 대상이 아님
+    async def _find_boundary_page(self, cutoff_dt, start_page=1):
+        async def is_past(page_num):
+            # 목록에 없는 페이지만 경계 이후로 판단 (이동 중 오류는 수집 실패로 전달)
+            if not await self._goto_list_page(page_num):
+                return True
+            posted, has_time = await self._get_first_row_posted()
+            return is_before_cutoff(posted, has_time, cutoff_dt)
+
+        if await is_past(start_page):
+            return start_page
+
+        lo, step, hi = start_page, 1, None
+        while hi is None:
+            if await is_past(lo + step):
+                hi = lo + step
+            else:
+                lo += step
+                step *= 2
+
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if await is_past(mid):
+                hi = mid
+            else:
+                lo = mid
+
+        logger.info("Cutoff boundary found.", extra={"page": lo, "phase": "boundary"})
+        if not await self._goto_list_page(start_page):
+            raise Exception(f"Could not return to list page {start_page} after boundary search.")
+        return lo
+
+    def log_paging_stats(self):
+        stats = self.paging_stats
+        per_notice = stats["seconds"] / stats["notices"] if stats["notices"] else 0.0
+        logger.info(
+            "Paging stats: %d turns, %.2fs total, %.3fs per notice",
+            stats["turns"], stats["seconds"], per_notice,
+            extra={"phase": "paging", "count": stats["notices"], "duration": round(stats["seconds"], 3)}
+        )
 
     # 입찰 공고 목록 검색 
     @retry_action(max_retries=3, delay=2)
     async def search_period(self, start_date, end_date):
             
-            print(f"[INFO] Search initiated: {start_date} ~ {end_date}")
+            logger.info("Search initiated: %s ~ %s", start_date, end_date, extra={"phase": "search"})
+            self.search_dates = (start_date, end_date)
 
             try:
-                await self.page.goto(self.base_url, wait_until="networkidle")
+                async with self.governor.track():
+                    await self.page.goto(self.base_url, wait_until="networkidle")
                 
                 try:
                     await self.page.wait_for_selector("#___processbar2", state="hidden", timeout=10000)
@@ -135,21 +434,26 @@ class NuriCrawler:
 
                 await self._clear_overlays()
 
-                print("[DEBUG] Hovering main menu...")
+                logger.debug("Hovering main menu...")
                 main_menu = self.page.locator("text=입찰공고").locator("visible=true").first
                 await main_menu.hover()
                 
-                print("[DEBUG] Clicking sub menu...")
+                logger.debug("Clicking sub menu...")
                 sub_menu = self.page.locator("text=입찰공고목록").locator("visible=true").first
-                await sub_menu.click()
+                async with self.governor.track():
+                    await sub_menu.click()
                 
                 await self.page.wait_for_selector("input[title*='시작 날짜']", timeout=10000)
 
                 await self._input_date_field("input[title*='시작 날짜']", start_date)
                 await self._input_date_field("input[title*='종료 날짜']", end_date)
 
-                print("[DEBUG] Clicking search button...")
-                await self.page.click("input[value='검색']")
+                # 페이지당 행 수를 최대로 설정하여 페이지 이동 횟수 감소
+                await self._set_max_page_size()
+
+                logger.debug("Clicking search button...")
+                async with self.governor.track():
+                    await self.page.click("input[value='검색']")
 
                 await self.page.wait_for_timeout(1500)
                 
@@ -159,11 +463,11 @@ class NuriCrawler:
                     pass
                 
                 await self.page.wait_for_selector("td[col_id='bidPbancNum']", timeout=10000)
-                print("[INFO] Search results loaded.")
+                logger.info("Search results loaded.", extra={"phase": "search"})
                 return True
 
             except Exception as e:
-                print(f"[ERROR] Search failed: {e}")
+                logger.error("Search failed: %s", e, extra={"phase": "search"})
                 return False
     
     # 입찰 공고 일반 탭으로 고정
@@ -176,11 +480,12 @@ class NuriCrawler:
                 
                 if "w2tabcontrol_selected" not in class_attr:
                     # print("[INFO] Switching to '입찰공고일반' tab...")
-                    await tab_link.click()
+                    async with self.governor.track():
+                        await tab_link.click()
                     await self.page.wait_for_selector("#mf_wfm_container_tabControl1_contents_content1_body", state="visible", timeout=5000)
                     await self.page.wait_for_timeout(500)
         except Exception as e:
-            print(f"[WARN] Tab switching error: {e}")
+            logger.warning("Tab switching error: %s", e)
 
     # 텍스트, 인풋 박스에 대한 데이터 추출
     async def _get_element_value(self, element):
@@ -229,7 +534,7 @@ class NuriCrawler:
                     if key:
                         data[key] = val
         except Exception as e:
-            print(f"[Error] Table parsing error: {e}")
+            logger.error("Table parsing error: %s", e)
         return data
     
     # 그리드 내 정보 파싱
@@ -307,7 +612,7 @@ class NuriCrawler:
             await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             await self.page.wait_for_timeout(1000) # 렌더링 대기
         except Exception as e:
-            print(f"[Error] Scroll down failed: {e}")
+            logger.error("Scroll down failed: %s", e)
 
         # 각 세션별 데이터 추출
         try:
@@ -369,33 +674,46 @@ class NuriCrawler:
                     detail_data["sections"][section_name] = table_data
 
         except Exception as e:
-            print(f"[WARN] Dynamic section scan failed: {e}")
+            logger.warning("Dynamic section scan failed: %s", e)
 
         return detail_data
 
     # 입찰 공고 목록 상세 페이지 조회
-    @retry_action(max_retries=3, delay=2)
-    async def crawl_period_pages(self, save_callback, stop_on_duplicate=False, cutoff_date=None):
+    @retry_action(max_retries=3, delay=2, no_retry=(ContextRestoreError,))
+    # cutoff_date: YYYYMMDD 또는 YYYYMMDDHHMM (워터마크), boundary_ids: 컷오프와 같은 일시에 이미 수집한 공고번호
+    async def crawl_period_pages(self, save_callback, stop_on_duplicate=False, cutoff_date=None, start_page=1, boundary_ids=None):
+
+        # 재시도 시에는 검색 상태를 다시 만들고 처리 중이던 페이지부터 이어서 수집
+        if self.resume_page is not None:
+            start_page = max(start_page, self.resume_page)
+            if not self.search_dates or not await self.search_period(*self.search_dates):
+                raise Exception("Search restore failed before resuming crawl.")
+            logger.info("Retrying crawl from list page.", extra={"page": start_page})
 
         current_page = 1
 
-        cutoff_dt = None
-        if cutoff_date:
-            try:
-                cutoff_dt = datetime.strptime(cutoff_date, "%Y%m%d")
-            except:
-                pass
+        # 재개 시 목표 페이지로 직접 이동
+        if start_page > 1:
+            if await self._goto_list_page(start_page):
+                current_page = start_page
+                logger.info("Resumed from list page.", extra={"page": start_page})
+            else:
+                logger.warning("Could not jump to page %d. Starting from page 1.", start_page)
+
+        # 컷오프 경계 페이지까지만 순회 (경계 이전 행은 행 단위로 건너뜀)
+        cutoff_dt = parse_cutoff(cutoff_date)
+        last_page = None
+        if needs_boundary_search(cutoff_dt, self.search_dates[0] if self.search_dates else None):
+            last_page = await self._find_boundary_page(cutoff_dt, current_page)
 
-        consecutive_old_count = 0
-        MAX_OLD_COUNT = 3
-        
         while True:
-            print(f"[INFO] Processing list page {current_page}...")
+            self.resume_page = current_page
+            logger.info("Processing list page", extra={"page": current_page})
             
             try:
                 await self.page.wait_for_selector("tr.grid_body_row", timeout=5000)
             except:
-                print("[INFO] No data rows found.")
+                logger.info("No data rows found.", extra={"page": current_page})
                 break
 
             rows = self.page.locator("tr.grid_body_row")
@@ -407,6 +725,7 @@ class NuriCrawler:
             stop_signal = False
 
             for i in range(count):
+                processed = False
                 try:
                     row = self.page.locator("tr.grid_body_row").nth(i)
                     id_cell = row.locator("td[col_id='bidPbancNum']")
@@ -415,33 +734,15 @@ class NuriCrawler:
                     if await id_cell.count() == 0 or await title_link.count() == 0:
                         continue
 
-                    # 컷오프 날짜 검사
-                    if cutoff_dt:
-                        row_text = await row.inner_text()
-                        date_match = re.search(r"(\d{4})/(\d{2})/(\d{2})", row_text)
-                        
-                        if date_match:
-                            row_date_str = f"{date_match.group(1)}{date_match.group(2)}{date_match.group(3)}"
-                            row_dt = datetime.strptime(row_date_str, "%Y%m%d")
-                            
-                            # 공고 게시 일시가 설정한 시작일보다 과거인 경우
-                            if row_dt < cutoff_dt:
-                                consecutive_old_count += 1
-                                print(f"[INFO] 과거 데이터 발견 ({row_date_str})")
-                                
-                                # 연속 3회 이상 과거 날짜면 종료 신호
-                                if consecutive_old_count >= MAX_OLD_COUNT:
-                                    print(f"[INFO] 날짜 범위 초과 확인. 수집을 종료합니다.")
-                                    stop_signal = True
-                                    break
-                                
-                                continue 
-                            else:
-                                # 최신 날짜가 나오면 카운트 리셋
-                                consecutive_old_count = 0
+                    notice_id = clean_text(await id_cell.inner_text())
 
+                    # 컷오프 검사 (게시일시가 컷오프 이전이거나 경계에서 이미 수집한 공고)
+                    if cutoff_dt:
+                        posted, has_time = parse_row_posted(await row.inner_text())
+                        if is_before_cutoff(posted, has_time, cutoff_dt, notice_id, boundary_ids):
+                            logger.debug("Skipping notice before cutoff", extra={"notice_id": notice_id, "page": current_page})
+                            continue
 
-                    notice_id = clean_text(await id_cell.inner_text())
                     title = clean_text(await title_link.inner_text())
 
                     should_process = save_callback(None, notice_id, check_only=True)
@@ -449,63 +750,86 @@ class NuriCrawler:
                     if not should_process:
                         # Interval / Cron 모드에서 중복 발견 시 종료
                         if stop_on_duplicate:
-                            print(f"[INFO] Found existing data ({notice_id}). Stopping crawler.")
+                            logger.info("Found existing data. Stopping crawler.", extra={"notice_id": notice_id, "page": current_page})
                             stop_signal = True
                             break
                         # History 모드에서 중복 발견 시 스킵
                         else:
-                            print(f"[DEBUG] Skipping duplicate: {notice_id}")
+                            logger.debug("Skipping duplicate", extra={"notice_id": notice_id, "page": current_page})
                             continue
 
-                    await title_link.click()
-                    await self.page.wait_for_selector("td[data-title='입찰공고번호']", timeout=15000)
+                    notice_started = time.perf_counter()
+                    if self.diagnostics:
+                        await self.diagnostics.begin(notice_id)
+
+                    async with self._phase("open_detail"), self.governor.track():
+                        await title_link.click()
+                        await self.page.wait_for_selector("td[data-title='입찰공고번호']", timeout=15000)
 
-                    extracted_data = await self.extract_detail_info()
+                    async with self._phase("extract"):
+                        extracted_data = await self.extract_detail_info()
                     extracted_data["id"] = notice_id
                     extracted_data["title"] = title
                     extracted_data["crawled_at"] = datetime.now().isoformat()
 
-                    save_callback(extracted_data, notice_id, check_only=False)
+                    async with self._phase("save"):
+                        save_callback(extracted_data, notice_id, check_only=False)
+                    self.paging_stats["notices"] += 1
+                    logger.info("Notice processed", extra={
+                        "notice_id": notice_id, "page": current_page, "phase": "detail",
+                        "duration": round(time.perf_counter() - notice_started, 3)
+                    })
+
+                    # 상세 화면이 남아 있을 때 이상 여부 판단 (목록 복귀 시간은 별도 단계로 측정)
+                    if self.diagnostics:
+                        await self.diagnostics.capture(self.page)
 
-                    await self.page.click("input[value='목록']")
-                    await self.page.wait_for_selector("td[col_id='bidPbancNum']", timeout=10000)
+                    async with self._phase("back_to_list"), self.governor.track():
+                        await self.page.click("input[value='목록']")
+                        await self.page.wait_for_selector("td[col_id='bidPbancNum']", timeout=10000)
+                    processed = True
+
+                    if self.diagnostics:
+                        await self.diagnostics.end(self.page)
 
                 except Exception as e:
-                    print(f"[ERROR] Failed to process row {i}: {e}")
+                    self.failed_notices += 1
+                    logger.error("Failed to process row %d: %s", i, e, extra={"page": current_page})
+                    # 목록 복귀 전 실패 화면 기록
+                    if self.diagnostics:
+                        await self.diagnostics.end(self.page, error=e)
                     try:
-                        await self.page.go_back()
-                        await self.page.wait_for_selector("td[col_id='bidPbancNum']")
+                        async with self.governor.track():
+                            await self.page.go_back()
+                            await self.page.wait_for_selector("td[col_id='bidPbancNum']")
                     except:
                         pass
 
+                # 메모리 임계치 또는 처리 건수 초과 시 컨텍스트 재생성 (실패 시 재시도 데코레이터로 전달)
+                if self.watchdog and processed:
+                    self.watchdog.notice_done()
+                    reason = await self.watchdog.check(self.page)
+                    if reason:
+                        await self._recycle_context(current_page, reason)
+
             # 동일 페이지 존재 시 종료
             if stop_signal:
                 break
 
-            next_page = current_page + 1
-            try:
-                await self._clear_overlays()
-
-                next_num_btn = self.page.locator(f"a.w2pageList_control_label[index='{next_page}']")
-                next_group_btn = self.page.locator("#mf_wfm_container_pagelist_next_btn")
+            if last_page is not None and current_page >= last_page:
+                logger.info("Reached cutoff boundary page.", extra={"page": current_page})
+                break
 
-                if await next_num_btn.is_visible():
-                    print(f"[DEBUG] Clicking page {next_page}")
-                    await next_num_btn.click()
-                elif await next_group_btn.is_visible():
-                    print("[DEBUG] Clicking next group button")
-                    await next_group_btn.click()
-                else:
-                    print("[INFO] Reached last page.")
-                    break
-                
-                await self.page.wait_for_timeout(1000)
-                try:
-                    await self.page.wait_for_selector("#___processbar2", state="hidden", timeout=5000)
-                except:
-                    pass
-                current_page += 1
+            next_page = current_page + 1
+            if await self._goto_list_page(next_page):
+                current_page = next_page
+            elif last_page is not None:
+                # 경계 탐색에서 확인한 페이지에 도달하지 못하면 남은 공고가 빠지므로 실패로 처리
+                raise Exception(f"Could not reach list page {next_page} before cutoff boundary page {last_page}.")
+            else:
+                logger.info("Reached last page.", extra={"page": current_page})
+                break
 
-            except Exception as e:
-                print(f"[ERROR] Pagination error: {e}")
-                break
\ No newline at end of file
+        self.resume_page = None
+        self.log_paging_stats()
+        self.governor.log_stats()
@@ -0,0 +1,135 @@
+import os
+import json
+import time
+from datetime import datetime
+from contextlib import asynccontextmanager
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 느린/실패 공고 진단 자료 수집
+# trace    : 공고마다 Playwright trace chunk를 기록하고, 이상 공고만 zip으로 저장 (정상 공고 chunk는 버림)
+# snapshot : 평소에는 단계별 시간만 측정하고, 이상 공고 발생 시 스크린샷과 DOM만 저장 (오버헤드 최소)
+class NoticeDiagnostics:
+    def __init__(self, mode="snapshot", out_dir="data/diagnostics", slow_threshold=15.0):
+        self.mode = mode
+        self.out_dir = out_dir
+        self.slow_threshold = slow_threshold
+
+        self.context = None
+        self.notice_id = None
+        self.started = None
+        self.phases = {}
+        self.saved = 0
+        # 목록 복귀 전에 기록한 이상 공고 정보 (end에서 JSON으로 저장)
+        self._pending = None
+        self._chunk_open = False
+
+        if not os.path.exists(self.out_dir):
+            os.makedirs(self.out_dir)
+
+    # 브라우저 컨텍스트 연결 (컨텍스트 재생성 시 다시 호출)
+    async def attach(self, context):
+        self.context = context
+        self.notice_id = None
+        self._pending = None
+        self._chunk_open = False
+        if self.mode == "trace":
+            try:
+                await context.tracing.start(screenshots=True, snapshots=True)
+            except Exception as e:
+                logger.warning("Tracing start failed: %s", e)
+
+    async def begin(self, notice_id):
+        self.notice_id = notice_id
+        self.started = time.perf_counter()
+        self.phases = {}
+        self._pending = None
+        if self.mode == "trace":
+            try:
+                await self.context.tracing.start_chunk(title=notice_id)
+                self._chunk_open = True
+            except Exception as e:
+                logger.warning("Tracing chunk start failed: %s", e, extra={"notice_id": notice_id})
+
+    # 단계별 소요 시간 측정
+    @asynccontextmanager
+    async def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round(time.perf_counter() - started, 3)
+
+    # 상세 화면에서 이상 여부 판단 및 기록 (목록 복귀 전에 호출해야 상세 화면이 남음)
+    # 이상 공고가 아니면 아무것도 남기지 않고, 목록 복귀 중 실패하면 end()에서 다시 호출됨
+    async def capture(self, page, error=None):
+        if self.notice_id is None or self._pending is not None:
+            return
+
+        notice_id = self.notice_id
+        elapsed = time.perf_counter() - self.started
+        is_outlier = error is not None or elapsed > self.slow_threshold
+        if not is_outlier:
+            if self.mode == "trace" and self._chunk_open:
+                self._chunk_open = False
+                try:
+                    await self.context.tracing.stop_chunk()
+                except Exception:
+                    pass
+            return
+
+        tag = "fail" if error is not None else "slow"
+        prefix = os.path.join(self.out_dir, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{notice_id}_{tag}")
+
+        try:
+            if self.mode == "trace":
+                if self._chunk_open:
+                    self._chunk_open = False
+                    await self.context.tracing.stop_chunk(path=f"{prefix}_trace.zip")
+            else:
+                await page.screenshot(path=f"{prefix}.png", full_page=True)
+                with open(f"{prefix}.html", "w", encoding="utf-8") as f:
+                    f.write(await page.content())
+        except Exception as e:
+            logger.warning("Diagnostics capture failed: %s", e, extra={"notice_id": notice_id})
+
+        self._pending = {
+            "prefix": prefix,
+            "status": tag,
+            "elapsed": round(elapsed, 3),
+            "error": str(error) if error is not None else None,
+            "url": page.url if page else None
+        }
+
+    # 공고 처리 종료 (목록 복귀 단계까지의 소요 시간을 포함해 이상 공고만 저장)
+    async def end(self, page, error=None):
+        if self.notice_id is None:
+            return
+        await self.capture(page, error)
+
+        notice_id = self.notice_id
+        total = time.perf_counter() - self.started
+        pending = self._pending
+        self.notice_id = None
+        self._pending = None
+        if pending is None:
+            return
+
+        meta = {
+            "bidPbancNum": notice_id,
+            "status": pending["status"],
+            "elapsed": pending["elapsed"],
+            "total": round(total, 3),
+            "phases": self.phases,
+            "error": pending["error"],
+            "url": pending["url"],
+            "captured_at": datetime.now().isoformat()
+        }
+        with open(f"{pending['prefix']}.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+        self.saved += 1
+        logger.warning("Diagnostics saved (%s)", pending["status"], extra={
+            "notice_id": notice_id, "phase": "diagnostics", "duration": pending["elapsed"]
+        })
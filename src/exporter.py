@@ -0,0 +1,270 @@
+import os
+import csv
+import json
+from datetime import datetime
+from src.normalize import get_typed
+from src.schema import column_name
+
+# JSONL 저장 데이터를 일정 크기 단위로 읽어 xlsx/CSV/Parquet 파일로 내보내기
+# 레코드를 한 번에 메모리에 올리지 않으므로 데이터 양과 관계없이 메모리 사용량이 일정합니다.
+# pandas/openpyxl/pyarrow는 실제 파일을 쓸 때만 불러오므로 크롤러 시작 비용에 포함되지 않습니다.
+
+BASE_COLUMNS = ["수집ID", "공고명", "수집일시"]
+FILE_COLUMNS = ["첨부파일_개수", "첨부파일_목록"]
+
+
+# 공고 레코드 1건을 엑셀 Row 형태로 변환 (금액/일시는 typed 값 사용)
+def flatten_record(item):
+    row = {
+        "수집ID": item.get("id"),
+        "공고명": item.get("title"),
+        "수집일시": item.get("crawled_at")
+    }
+
+    typed = get_typed(item)
+    sections = item.get("sections", {})
+    for section_name, section_data in sections.items():
+
+        # 테이블 데이터 - 키를 컬럼으로 사용
+        if isinstance(section_data, dict):
+            typed_section = typed.get(section_name, {})
+            for key, value in section_data.items():
+                # 컬럼명 충돌 방지 (공고일반은 접두어 없이, 나머지는 "섹션명_키")
+                col_name = column_name(section_name, key)
+                if col_name not in row:
+                    row[col_name] = typed_section.get(key, value)
+
+        # 그리드 데이터 - 요약 정보로 변환
+        elif isinstance(section_data, list):
+            summary_list = []
+            for idx, grid_row in enumerate(section_data):
+                row_str = " | ".join([str(v) for v in grid_row.values()])
+                summary_list.append(f"[{idx+1}] {row_str}")
+            row[section_name] = "\n".join(summary_list)
+
+    # 첨부파일 정보 요약
+    files = item.get("files", [])
+    row["첨부파일_개수"] = len(files)
+    row["첨부파일_목록"] = "\n".join(_file_names(files))
+
+    return row
+
+def _file_names(files):
+    names = []
+    for f in files:
+        name = f.get("파일명") or f.get("orgnlAtchFileNm")
+        if name:
+            names.append(name)
+    return names
+
+# typed 값이 들어가는 컬럼과 타입
+def typed_columns(item):
+    for section_name, fields in get_typed(item).items():
+        for key, value in fields.items():
+            yield column_name(section_name, key), "money" if isinstance(value, int) else "datetime"
+
+# 공고 게시일 (없으면 수집일) - YYYYMMDD
+def record_date(item):
+    for key, value in get_typed(item).get("공고일반", {}).items():
+        if "게시일" in key and isinstance(value, str):
+            return value[:10].replace("-", "")
+    crawled_at = item.get("crawled_at") or ""
+    return crawled_at[:10].replace("-", "")
+
+def _matches(item, start_date=None, end_date=None, agency=None, keyword=None):
+    if start_date or end_date:
+        day = record_date(item)
+        if not day:
+            return False
+        if start_date and day < start_date:
+            return False
+        if end_date and day > end_date:
+            return False
+
+    general = item.get("sections", {}).get("공고일반", {})
+    if not isinstance(general, dict):
+        general = {}
+
+    if agency:
+        agencies = [str(v) for k, v in general.items() if "기관" in k]
+        if not any(agency in name for name in agencies):
+            return False
+
+    if keyword:
+        haystack = [item.get("title") or ""]
+        haystack.extend(str(v) for v in general.values())
+        haystack.extend(_file_names(item.get("files", [])))
+        if not any(keyword in text for text in haystack):
+            return False
+
+    return True
+
+# 조건에 맞는 레코드를 한 줄씩 읽어 반환
+def iter_records(jsonl_path, start_date=None, end_date=None, agency=None, keyword=None):
+    if not os.path.exists(jsonl_path):
+        return
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if _matches(item, start_date, end_date, agency, keyword):
+                yield item
+
+# 비어 있지 않은 줄 수 (파생 저장소가 JSONL과 일치하는지 확인할 때 사용)
+def count_lines(jsonl_path):
+    if not os.path.exists(jsonl_path):
+        return 0
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        return sum(1 for line in f if line.strip())
+
+def iter_chunks(rows, chunk_size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# 1차 순회: 전체 컬럼 목록과 typed 컬럼 타입 수집 (컬럼명만 보관)
+def collect_columns(records):
+    columns = list(BASE_COLUMNS)
+    seen = set(columns) | set(FILE_COLUMNS)
+    types = {"첨부파일_개수": "count"}
+    count = 0
+    for item in records:
+        count += 1
+        for col in flatten_record(item):
+            if col not in seen:
+                seen.add(col)
+                columns.append(col)
+        for col, ftype in typed_columns(item):
+            types.setdefault(col, ftype)
+    columns.extend(FILE_COLUMNS)
+    return columns, count, types
+
+
+def _to_datetime(value):
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return value
+
+def _write_xlsx(out_path, columns, types, chunks):
+    from openpyxl import Workbook
+
+    date_columns = {col for col, ftype in types.items() if ftype == "datetime"}
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("nuri_data")
+    ws.append(columns)
+    for chunk in chunks:
+        for row in chunk:
+            ws.append([_to_datetime(row.get(col)) if col in date_columns else row.get(col) for col in columns])
+    wb.save(out_path)
+
+def _write_csv(out_path, columns, types, chunks):
+    # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+    with open(out_path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for chunk in chunks:
+            writer.writerows(chunk)
+
+def _write_parquet(out_path, columns, types, chunks):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # 금액/건수는 int64, 일시는 timestamp, 나머지는 문자열
+    arrow_types = {"count": pa.int64(), "money": pa.int64(), "datetime": pa.timestamp("s")}
+    schema = pa.schema([pa.field(col, arrow_types.get(types.get(col), pa.string())) for col in columns])
+    with pq.ParquetWriter(out_path, schema) as writer:
+        for chunk in chunks:
+            arrays = []
+            for field in schema:
+                values = [row.get(field.name) for row in chunk]
+                if field.type == pa.string():
+                    values = [None if v is None else str(v) for v in values]
+                elif field.type == pa.int64():
+                    values = [v if isinstance(v, int) else None for v in values]
+                else:
+                    values = [_to_datetime(v) if isinstance(v, str) else None for v in values]
+                    values = [v if isinstance(v, datetime) else None for v in values]
+                arrays.append(pa.array(values, type=field.type))
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+
+# 엑셀 파일에 레코드 추가 (저장소의 백그라운드 스레드에서 호출)
+# 기존 헤더 순서는 그대로 두고 새 컬럼만 오른쪽에 추가하므로 기존 행을 다시 정렬하지 않음
+def append_excel(excel_path, data_list):
+    from openpyxl import Workbook, load_workbook
+
+    if os.path.exists(excel_path):
+        wb = load_workbook(excel_path)
+        ws = wb.active
+        header = [cell.value for cell in ws[1]]
+    else:
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "nuri_data"
+        header = []
+
+    rows = []
+    date_columns = set()
+    for item in data_list:
+        row = flatten_record(item)
+        rows.append(row)
+        date_columns.update(col for col, ftype in typed_columns(item) if ftype == "datetime")
+        for col in row:
+            if col not in header:
+                header.append(col)
+                ws.cell(row=1, column=len(header), value=col)
+
+    for row in rows:
+        ws.append([_to_datetime(row.get(col)) if col in date_columns else row.get(col) for col in header])
+
+    wb.save(excel_path)
+    return ws.max_row - 1
+
+WRITERS = {
+    "xlsx": _write_xlsx,
+    "csv": _write_csv,
+    "parquet": _write_parquet
+}
+
+# columns를 지정하면 해당 컬럼만 내보내며, 스키마 레지스트리로 타입을 정하므로 한 번만 순회
+def export_records(jsonl_path, out_path, fmt="xlsx", chunk_size=1000,
+                   start_date=None, end_date=None, agency=None, keyword=None,
+                   columns=None, schema=None):
+    if fmt not in WRITERS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    filters = {"start_date": start_date, "end_date": end_date, "agency": agency, "keyword": keyword}
+
+    if columns:
+        types = {"첨부파일_개수": "count"}
+        if schema is not None:
+            types.update(schema.column_types())
+        count = 0
+
+        def selected_rows():
+            nonlocal count
+            for item in iter_records(jsonl_path, **filters):
+                count += 1
+                row = flatten_record(item)
+                yield {col: row.get(col) for col in columns}
+
+        WRITERS[fmt](out_path, columns, types, iter_chunks(selected_rows(), chunk_size))
+        return count
+
+    # 헤더를 먼저 확정해야 하므로 두 번 순회
+    columns, count, types = collect_columns(iter_records(jsonl_path, **filters))
+
+    rows = (flatten_record(item) for item in iter_records(jsonl_path, **filters))
+    WRITERS[fmt](out_path, columns, types, iter_chunks(rows, chunk_size))
+    return count
@@ -0,0 +1,183 @@
+import os
+import time
+import sqlite3
+import asyncio
+from contextlib import asynccontextmanager
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 전체 요청 속도 제어기 (토큰 버킷 + AIMD)
+# 모든 페이지 이동/클릭/API 요청은 토큰을 하나씩 소비하며,
+# 응답이 빠르면 속도를 조금씩 올리고(가산 증가), 지연/오류가 발생하면 크게 낮춥니다(승산 감소).
+# state_path를 지정하면 버킷 상태를 SQLite에 두어 여러 프로세스/컨테이너가 같은 한도를 공유합니다.
+# 공유 속도는 버킷을 처음 만들 때(또는 stale_after초 이상 아무도 사용하지 않았을 때) --rate 값으로 정해지고,
+# 이후에는 AIMD로 조정된 값을 유지합니다. 각 프로세스는 자신의 [min_rate, max_rate] 범위로 제한해 사용합니다.
+# SQLite 접근은 이벤트 루프를 막지 않도록 별도 스레드에서 실행합니다.
+class RateGovernor:
+    def __init__(self, rate=2.0, burst=4, min_rate=0.2, max_rate=10.0,
+                 target_latency=3.0, increase_step=0.1, decrease_factor=0.5, state_path=None, stale_after=600):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.target_latency = target_latency
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.state_path = state_path
+        self.stale_after = stale_after
+
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+        # 관측 통계
+        self.stats = {"requests": 0, "errors": 0, "timeouts": 0, "slow": 0}
+
+        if self.state_path:
+            state_dir = os.path.dirname(self.state_path)
+            if state_dir and not os.path.exists(state_dir):
+                os.makedirs(state_dir)
+            self._init_shared()
+
+    def _clamp(self, rate):
+        return max(self.min_rate, min(self.max_rate, rate))
+
+    def _connect(self):
+        conn = sqlite3.connect(self.state_path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    def _init_shared(self):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS bucket (name TEXT PRIMARY KEY, tokens REAL, rate REAL, updated REAL)"
+            )
+            # 다른 프로세스가 사용 중인 버킷은 감속 상태를 유지하도록 그대로 두고, 오래 쓰이지 않은 버킷만 다시 시작
+            now = time.time()
+            conn.execute(
+                "INSERT INTO bucket (name, tokens, rate, updated) VALUES ('global', ?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET tokens = excluded.tokens, rate = excluded.rate, updated = excluded.updated "
+                "WHERE bucket.updated < ?",
+                (float(self.burst), self._clamp(self.rate), now, now - self.stale_after)
+            )
+        finally:
+            conn.close()
+
+    # 공유 버킷에서 토큰 하나를 시도 (획득 시 0, 아니면 대기해야 할 초)
+    def _take_shared(self):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            tokens, rate, updated = conn.execute(
+                "SELECT tokens, rate, updated FROM bucket WHERE name = 'global'"
+            ).fetchone()
+            # 다른 프로세스가 더 높은 한도로 올려 둔 속도도 이 프로세스의 범위 안에서만 사용
+            rate = self._clamp(rate)
+            now = time.time()
+            tokens = min(float(self.burst), tokens + (now - updated) * rate)
+            self.rate = rate
+
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate
+
+            conn.execute(
+                "UPDATE bucket SET tokens = ?, updated = ? WHERE name = 'global'",
+                (tokens, now)
+            )
+            conn.execute("COMMIT")
+            return wait
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _take_local(self):
+        now = time.monotonic()
+        self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    # 토큰 획득까지 대기
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                wait = await asyncio.to_thread(self._take_shared) if self.state_path else self._take_local()
+                if wait <= 0:
+                    self.stats["requests"] += 1
+                    return
+                await asyncio.sleep(wait)
+
+    def _set_rate(self, new_rate):
+        new_rate = self._clamp(new_rate)
+        if self.state_path:
+            conn = self._connect()
+            try:
+                # 다른 프로세스의 조정 결과를 기준으로 갱신
+                conn.execute("BEGIN IMMEDIATE")
+                current = conn.execute("SELECT rate FROM bucket WHERE name = 'global'").fetchone()[0]
+                ratio = new_rate / self.rate if self.rate else 1.0
+                new_rate = self._clamp(current * ratio)
+                conn.execute("UPDATE bucket SET rate = ? WHERE name = 'global'", (new_rate,))
+                conn.execute("COMMIT")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+            finally:
+                conn.close()
+        self.rate = new_rate
+
+    # 응답 지연에 따른 속도 조정
+    def record_success(self, latency):
+        if latency > self.target_latency:
+            self.stats["slow"] += 1
+            self._set_rate(self.rate * (1 - (1 - self.decrease_factor) / 2))
+        else:
+            self._set_rate(self.rate + self.increase_step)
+
+    # 오류/타임아웃 발생 시 속도 감소
+    def record_failure(self, error=None):
+        self.stats["errors"] += 1
+        if error is not None and "Timeout" in type(error).__name__:
+            self.stats["timeouts"] += 1
+        self._set_rate(self.rate * self.decrease_factor)
+
+    # 공유 상태를 쓰는 경우 속도 조정을 별도 스레드에서 실행
+    async def _record(self, func, *args):
+        if self.state_path:
+            await asyncio.to_thread(func, *args)
+        else:
+            func(*args)
+
+    async def record_failure_async(self, error=None):
+        await self._record(self.record_failure, error)
+
+    # 토큰을 획득하고 동작의 소요 시간을 측정
+    @asynccontextmanager
+    async def track(self):
+        await self.acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            await self.record_failure_async(e)
+            # retry_action에서 중복 집계하지 않도록 표시
+            e.governor_recorded = True
+            raise
+        await self._record(self.record_success, time.monotonic() - started)
+
+    def log_stats(self):
+        logger.info(
+            "Rate stats: %.2f req/s, requests %d, errors %d (timeouts %d), slow %d",
+            self.rate, self.stats["requests"], self.stats["errors"], self.stats["timeouts"], self.stats["slow"],
+            extra={"phase": "rate"}
+        )
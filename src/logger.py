@@ -0,0 +1,146 @@
+import os
+import sys
+import copy
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+# 비동기 로깅 설정
+# 로그 레코드는 큐에 넣기만 하고, 실제 stdout 쓰기는 백그라운드 스레드가 담당하여
+# Docker 로그 드라이버의 I/O 지연이 크롤러 이벤트 루프를 막지 않습니다.
+#
+# 환경 변수
+#   NURI_LOG_LEVEL   기본 로그 레벨 (default: INFO)
+#   NURI_LOG_LEVELS  모듈별 레벨 (예: "src.crawler=DEBUG,src.storage=WARNING")
+#   NURI_LOG_FORMAT  json | text (default: json)
+#   NURI_LOG_RATE    같은 메시지 허용 빈도 "건수/초" (default: 20/10)
+
+# JSON 출력에 포함할 구조화 필드
+STRUCTURED_FIELDS = ("notice_id", "page", "phase", "duration", "count", "worker", "reason")
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False)
+
+
+# 기본 QueueHandler.prepare는 traceback을 msg에 합친 뒤 exc_info를 지우므로 JSON의 exc 필드가 사라짐
+# 메시지 인자만 확정하고 traceback은 exc_text로 따로 넘겨 출력 스레드의 포매터가 필드로 기록하도록 함
+class StructuredQueueHandler(QueueHandler):
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s [%(levelname)s] %(name)s: %(message)s", "%H:%M:%S")
+
+    def format(self, record):
+        text = super().format(record)
+        extras = [f"{field}={getattr(record, field)}" for field in STRUCTURED_FIELDS
+                  if getattr(record, field, None) is not None]
+        return f"{text} ({', '.join(extras)})" if extras else text
+
+
+# 같은 메시지 템플릿이 짧은 시간에 반복되면 일부만 출력 (억제 건수는 다음 출력에 표시)
+class RateLimitFilter(logging.Filter):
+    def __init__(self, max_count=20, window=10.0):
+        super().__init__()
+        self.max_count = max_count
+        self.window = window
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        # 경고 이상은 항상 출력
+        if record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            started, count, suppressed = self._buckets.get(key, (now, 0, 0))
+            if now - started > self.window:
+                started, count = now, 0
+
+            if count >= self.max_count:
+                self._buckets[key] = (started, count, suppressed + 1)
+                return False
+
+            self._buckets[key] = (started, count + 1, 0)
+
+        if suppressed:
+            record.msg = f"{record.msg} (+{suppressed} similar suppressed)"
+        return True
+
+
+def _parse_rate(value):
+    try:
+        count, window = value.split("/")
+        return int(count), float(window)
+    except (AttributeError, ValueError):
+        return 20, 10.0
+
+def setup_logging(level=None, fmt=None):
+    global _listener
+    if _listener is not None:
+        return
+
+    level = (level or os.environ.get("NURI_LOG_LEVEL", "INFO")).upper()
+    fmt = (fmt or os.environ.get("NURI_LOG_FORMAT", "json")).lower()
+    max_count, window = _parse_rate(os.environ.get("NURI_LOG_RATE", "20/10"))
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter(max_count, window))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+
+    # 모듈별 레벨
+    for item in os.environ.get("NURI_LOG_LEVELS", "").split(","):
+        if "=" in item:
+            name, module_level = item.split("=", 1)
+            logging.getLogger(name.strip()).setLevel(module_level.strip().upper())
+
+    # 외부 라이브러리 로그는 경고 이상만
+    logging.getLogger("apscheduler").setLevel(logging.WARNING)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # 종료 시 큐에 남은 로그 출력
+    atexit.register(_listener.stop)
+
+def get_logger(name):
+    return logging.getLogger(name)
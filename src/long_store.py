@@ -0,0 +1,213 @@
+import os
+import json
+import sqlite3
+from src.schema import SchemaRegistry, FILES_SECTION, COLUMNS_TABLE_SQL
+from src.normalize import get_typed
+from src.exporter import iter_records, count_lines
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 세로형(long) 공고 저장소 (SQLite)
+# 공고 1건을 (공고번호, 컬럼 ID, 행 번호, 값) 셀로 나누어 저장하고, 화면/내보내기에 필요한 컬럼만
+# 골라 가로형으로 펼칩니다(pivot). 대부분 비어 있는 넓은 표를 만들거나 재정렬할 필요가 없습니다.
+# 테이블 항목은 행 번호 0, 그리드와 첨부파일은 그리드 행 순서대로 저장됩니다.
+# 컬럼 ID 등록과 셀 기록은 같은 쓰기 트랜잭션에서 처리되므로 여러 프로세스가 함께 기록해도 ID가 겹치지 않습니다.
+
+BASE_FIELDS = {"수집ID": "notice_id", "공고명": "title", "수집일시": "crawled_at"}
+FILE_FIELDS = ("첨부파일_개수", "첨부파일_목록")
+
+
+def _cell_value(value):
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+def _connect(db_path):
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+
+class LongStore:
+    def __init__(self, save_dir="data"):
+        self.db_path = os.path.join(save_dir, "nuri_long.db")
+        self.conn = _connect(self.db_path)
+        self.conn.executescript(COLUMNS_TABLE_SQL + """
+            CREATE TABLE IF NOT EXISTS notices (
+                notice_id TEXT PRIMARY KEY,
+                title TEXT,
+                crawled_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS cells (
+                notice_id TEXT NOT NULL,
+                col_id INTEGER NOT NULL,
+                row INTEGER NOT NULL,
+                value,
+                PRIMARY KEY (notice_id, col_id, row)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_cells_col ON cells (col_id, row);
+        """)
+        self.schema = SchemaRegistry(self.conn)
+
+    # JSONL에는 있지만 저장소에 없는 공고(최초 실행, 저장 중 실패 등)를 채워 넣음
+    # 공고 수가 JSONL 줄 수와 같으면 JSONL을 읽지 않음
+    def ensure_built(self, jsonl_path):
+        lines = count_lines(jsonl_path)
+        if self.conn.execute("SELECT COUNT(*) FROM notices").fetchone()[0] == lines:
+            return
+        count = 0
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 다른 프로세스가 먼저 채운 공고는 건너뜀
+            stored = {row[0] for row in self.conn.execute("SELECT notice_id FROM notices")}
+            filled = set()
+            for item in iter_records(jsonl_path):
+                notice_id = item.get("id")
+                # 같은 공고가 여러 줄이면 마지막 줄로 교체됨
+                if notice_id and notice_id not in stored:
+                    self._write(item)
+                    filled.add(notice_id)
+            count = len(filled)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            self.schema.refresh()
+            raise
+        if count:
+            logger.info("Long store filled %d records from JSONL.", count)
+
+    def _cells(self, record):
+        typed = get_typed(record)
+        for section_name, section_data in record.get("sections", {}).items():
+            if isinstance(section_data, dict):
+                typed_section = typed.get(section_name, {})
+                for key, value in section_data.items():
+                    typed_value = typed_section.get(key)
+                    ftype = None if typed_value is None else ("money" if isinstance(typed_value, int) else "datetime")
+                    col_id = self.schema.column_id(section_name, key, "field", ftype)
+                    yield col_id, 0, typed_value if typed_value is not None else value
+            elif isinstance(section_data, list):
+                for idx, grid_row in enumerate(section_data):
+                    for key, value in grid_row.items():
+                        yield self.schema.column_id(section_name, key, "grid"), idx, _cell_value(value)
+
+        for idx, file_info in enumerate(record.get("files", [])):
+            for key, value in file_info.items():
+                yield self.schema.column_id(FILES_SECTION, key, "grid"), idx, _cell_value(value)
+
+    def _write(self, record):
+        notice_id = record.get("id")
+        if not notice_id:
+            return
+        # 같은 공고를 다시 저장하면 최신 내용으로 교체
+        self.conn.execute("DELETE FROM cells WHERE notice_id = ?", (notice_id,))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO notices (notice_id, title, crawled_at) VALUES (?, ?, ?)",
+            (notice_id, record.get("title"), record.get("crawled_at"))
+        )
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO cells (notice_id, col_id, row, value) VALUES (?, ?, ?, ?)",
+            [(notice_id, col_id, row, value) for col_id, row, value in self._cells(record)]
+        )
+
+    def add(self, record):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._write(record)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            # 롤백된 컬럼 등록이 캐시에 남지 않도록 다시 읽음
+            self.schema.refresh()
+            raise
+
+    def close(self):
+        self.conn.close()
+
+
+def _file_summaries(conn, schema):
+    name_ids = [col["id"] for col in schema.columns
+                if col["section"] == FILES_SECTION and col["key"] in ("파일명", "orgnlAtchFileNm")]
+    files = {}
+    if not name_ids:
+        return files
+    sql = f"SELECT notice_id, value FROM cells WHERE col_id IN ({','.join('?' * len(name_ids))}) ORDER BY notice_id, row"
+    for notice_id, value in conn.execute(sql, name_ids):
+        files.setdefault(notice_id, []).append(str(value))
+    return files
+
+# 필요한 컬럼만 가로형으로 펼치기 (읽기 전용, 최신 수집순)
+# names: 평면 뷰 컬럼명 목록 (수집ID/공고명/수집일시, 항목 컬럼, 첨부파일_개수/첨부파일_목록)
+def read_pivot(save_dir="data", names=None, limit=None):
+    db_path = os.path.join(save_dir, "nuri_long.db")
+    if not os.path.exists(db_path):
+        return []
+
+    conn = _connect(db_path)
+    try:
+        schema = SchemaRegistry(conn)
+        field_ids = schema.field_ids()
+        if names is None:
+            names = list(BASE_FIELDS) + list(field_ids) + list(FILE_FIELDS)
+
+        sql = "SELECT notice_id, title, crawled_at FROM notices ORDER BY crawled_at DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        rows = {}
+        for notice_id, title, crawled_at in conn.execute(sql):
+            base = {"notice_id": notice_id, "title": title, "crawled_at": crawled_at}
+            rows[notice_id] = {name: base[BASE_FIELDS[name]] for name in names if name in BASE_FIELDS}
+
+        wanted = {field_ids[name]: name for name in names if name in field_ids}
+        if wanted:
+            sql = f"SELECT notice_id, col_id, value FROM cells WHERE row = 0 AND col_id IN ({','.join('?' * len(wanted))})"
+            for notice_id, col_id, value in conn.execute(sql, list(wanted)):
+                row = rows.get(notice_id)
+                if row is not None:
+                    row[wanted[col_id]] = value
+
+        if any(name in FILE_FIELDS for name in names):
+            files = _file_summaries(conn, schema)
+            for notice_id, row in rows.items():
+                names_list = files.get(notice_id, [])
+                if "첨부파일_개수" in names:
+                    row["첨부파일_개수"] = len(names_list)
+                if "첨부파일_목록" in names:
+                    row["첨부파일_목록"] = "\n".join(names_list)
+    finally:
+        conn.close()
+
+    return [{name: row.get(name) for name in names} for row in rows.values()]
+
+# 그리드 섹션 1개를 (공고번호, 행) 단위 표로 펼치기
+def read_grid(section_name, save_dir="data"):
+    db_path = os.path.join(save_dir, "nuri_long.db")
+    if not os.path.exists(db_path):
+        return []
+
+    conn = _connect(db_path)
+    try:
+        keys = {col["id"]: col["key"] for col in SchemaRegistry(conn).columns
+                if col["kind"] == "grid" and col["section"] == section_name}
+        if not keys:
+            return []
+        grid = {}
+        sql = f"SELECT notice_id, row, col_id, value FROM cells WHERE col_id IN ({','.join('?' * len(keys))}) ORDER BY notice_id, row"
+        for notice_id, row, col_id, value in conn.execute(sql, list(keys)):
+            grid.setdefault((notice_id, row), {"수집ID": notice_id, "행": row + 1})[keys[col_id]] = value
+    finally:
+        conn.close()
+    return list(grid.values())
+
+# 내보내기/대시보드용 읽기 전용 스키마 (저장소가 없으면 None)
+def load_schema(save_dir="data"):
+    db_path = os.path.join(save_dir, "nuri_long.db")
+    if not os.path.exists(db_path):
+        return None
+    conn = _connect(db_path)
+    try:
+        return SchemaRegistry(conn)
+    finally:
+        conn.close()
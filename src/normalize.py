@@ -0,0 +1,133 @@
+import re
+from datetime import datetime
+
+# 수집 값 타입 정규화
+# 화면 문자열("1,234,000 원", "2025/01/01 10:00")은 그대로 두고, 금액/일시는 정수/ISO 일시로 변환한
+# typed 값을 레코드에 함께 저장합니다. 엑셀/대시보드/내보내기는 이 값으로 숫자·날짜 컬럼을 만들어
+# 문자열 비교 대신 벡터 연산으로 필터링/정렬할 수 있습니다.
+
+MONEY_PATTERN = re.compile(r"\d[\d,]*")
+MONEY_VALUE_PATTERN = re.compile(r"^[\d,]+\s*원$")
+DATETIME_PATTERN = re.compile(
+    r"(\d{4})[./-](\d{1,2})[./-](\d{1,2})(?:\s*(\d{1,2}):(\d{2})(?::(\d{2}))?)?"
+)
+
+# 필드 타입 레지스트리 (항목명에 포함된 단어 기준, 앞에서부터 우선)
+# enum은 값 변환 없이 표 형태로 읽을 때 범주형(category) 컬럼으로만 사용
+# "예정가격결정방법", "기초금액공개여부"처럼 enum 단어로 끝나는 항목은 금액/일시 단어를 포함해도 enum으로 판단
+FIELD_TYPES = [
+    ("money", ["금액", "가격", "예산", "예정가", "추정가"]),
+    ("datetime", ["일시", "일자", "게시일", "마감일", "개찰일"]),
+    ("enum", ["방식", "방법", "구분", "종류", "여부", "상태", "유형"])
+]
+
+ENUM_SUFFIXES = tuple(dict(FIELD_TYPES)["enum"])
+
+# typed 값으로 저장하는 타입
+STORED_TYPES = ("money", "datetime")
+
+# typed 값 계산 규칙 버전 (규칙이 바뀌면 이전에 저장된 typed 값은 다시 계산)
+TYPED_VERSION = 2
+
+_type_cache = {}
+
+
+def field_type(label):
+    if label not in _type_cache:
+        if label.endswith(ENUM_SUFFIXES):
+            _type_cache[label] = "enum"
+        else:
+            _type_cache[label] = next(
+                (ftype for ftype, words in FIELD_TYPES if any(word in label for word in words)), None
+            )
+    return _type_cache[label]
+
+def parse_money(text):
+    if text is None:
+        return None
+    if isinstance(text, int):
+        return text
+    # 값 전체가 "숫자 원" 형태인 경우만 금액으로 변환 ("복수예비가격 15개" 등은 원문 유지)
+    text = str(text).strip()
+    if not MONEY_VALUE_PATTERN.match(text):
+        return None
+    return int(MONEY_PATTERN.search(text).group().replace(",", ""))
+
+def parse_datetime(text):
+    if not text:
+        return None
+    match = DATETIME_PATTERN.search(str(text))
+    if not match:
+        return None
+    parts = [int(part) if part else 0 for part in match.groups()]
+    try:
+        return datetime(*parts).isoformat()
+    except ValueError:
+        return None
+
+PARSERS = {
+    "money": parse_money,
+    "datetime": parse_datetime
+}
+
+
+# 테이블 섹션의 금액/일시 항목을 타입 변환 ({섹션: {항목: 값}})
+def normalize_record(record):
+    typed = {}
+    for section_name, section_data in record.get("sections", {}).items():
+        if not isinstance(section_data, dict):
+            continue
+        for label, value in section_data.items():
+            ftype = field_type(label)
+            # 항목명으로 판단할 수 없는 경우 "숫자 원" 형태의 값은 금액으로 처리
+            if ftype is None and MONEY_VALUE_PATTERN.match(str(value)):
+                ftype = "money"
+            if ftype not in STORED_TYPES:
+                continue
+            parsed = PARSERS[ftype](value)
+            if parsed is not None:
+                typed.setdefault(section_name, {})[label] = parsed
+    return typed
+
+# 레코드의 typed 값 (typed 값이 없거나 이전 규칙으로 저장된 레코드는 즉시 계산)
+def get_typed(record):
+    typed = record.get("typed")
+    if typed is None or record.get("typed_version") != TYPED_VERSION:
+        typed = normalize_record(record)
+    return typed
+
+
+# DataFrame 컬럼을 레지스트리 타입으로 변환 (pandas는 호출 시점에만 로드)
+# 변환 시 값이 사라지는 컬럼은 타입이 맞지 않는 것으로 보고 그대로 둠
+def apply_dtypes(df):
+    import pandas as pd
+
+    for col in df.columns:
+        ftype = field_type(str(col))
+        if ftype is None:
+            continue
+        series = df[col]
+        present = series.notna() & (series.astype(str).str.strip() != "")
+
+        if ftype == "money":
+            if pd.api.types.is_integer_dtype(series):
+                converted = series.astype("Int64")
+            else:
+                # typed 정수 또는 값 전체가 "숫자 원" 형태인 값만 변환 (그 외는 NaN이 되어 컬럼을 그대로 둠)
+                text = series.astype(str).str.strip()
+                valid = text.str.fullmatch(r"\d+") | text.str.match(MONEY_VALUE_PATTERN.pattern)
+                digits = text.where(valid).str.extract(f"({MONEY_PATTERN.pattern})", expand=False)
+                converted = pd.to_numeric(digits.str.replace(",", "", regex=False), errors="coerce").astype("Int64")
+        elif ftype == "datetime":
+            if pd.api.types.is_datetime64_any_dtype(series):
+                continue
+            converted = pd.to_datetime(
+                series.astype(str).str.replace("/", "-", regex=False), errors="coerce", format="mixed"
+            )
+        else:
+            converted = series.astype("category")
+
+        if (converted[present].isna()).any():
+            continue
+        df[col] = converted
+    return df
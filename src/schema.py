@@ -0,0 +1,87 @@
+# 컬럼 스키마 레지스트리
+# (섹션, 항목) 쌍마다 처음 발견된 순서대로 고정 ID를 부여하여 세로형 저장소 DB의 columns 테이블에 보관합니다.
+# 세로형 저장소는 이 ID로 값을 기록하고, 엑셀/대시보드/내보내기는 ID 순서를 컬럼 순서로 사용하므로
+# 새 항목이 생겨도 기존 컬럼 위치가 바뀌지 않습니다.
+
+# 첨부파일 목록을 그리드처럼 저장할 때 사용하는 섹션명
+FILES_SECTION = "__files__"
+
+COLUMNS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS columns (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        section TEXT NOT NULL,
+        key TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        name TEXT NOT NULL,
+        type TEXT,
+        UNIQUE (section, key)
+    );
+"""
+
+
+# 평면 뷰 컬럼명 (공고일반은 접두어 없이, 나머지는 "섹션명_키")
+def column_name(section_name, key):
+    return key if section_name == "공고일반" else f"{section_name}_{key}"
+
+
+class SchemaRegistry:
+    def __init__(self, conn):
+        self.conn = conn
+        self.columns = []
+        self._ids = {}
+        self.refresh()
+
+    def refresh(self):
+        self.columns = []
+        self._ids = {}
+        for col_id, section_name, key, kind, name, ftype in self.conn.execute(
+            "SELECT id, section, key, kind, name, type FROM columns ORDER BY id"
+        ):
+            self._add(col_id, section_name, key, kind, name, ftype)
+
+    def _add(self, col_id, section_name, key, kind, name, ftype):
+        self.columns.append({
+            "id": col_id, "section": section_name, "key": key, "kind": kind, "name": name, "type": ftype
+        })
+        self._ids[(section_name, key)] = col_id
+
+    # (섹션, 항목)의 고정 ID (처음 보는 쌍이면 새로 등록)
+    # 여러 프로세스가 동시에 등록해도 같은 쌍은 DB의 UNIQUE 제약으로 하나의 ID만 갖도록 호출자의 쓰기 트랜잭션 안에서 실행
+    # kind: field(테이블 항목) | grid(그리드 컬럼), ftype: typed 값 타입 (money | datetime)
+    def column_id(self, section_name, key, kind="field", ftype=None):
+        col_id = self._ids.get((section_name, key))
+        if col_id is not None:
+            return col_id
+
+        name = column_name(section_name, key) if kind == "field" else f"{section_name}_{key}"
+        self.conn.execute(
+            "INSERT OR IGNORE INTO columns (section, key, kind, name, type) VALUES (?, ?, ?, ?, ?)",
+            (section_name, key, kind, name, ftype)
+        )
+        col_id, kind, name, ftype = self.conn.execute(
+            "SELECT id, kind, name, type FROM columns WHERE section = ? AND key = ?", (section_name, key)
+        ).fetchone()
+        self._add(col_id, section_name, key, kind, name, ftype)
+        return col_id
+
+    # 평면 뷰 항목 컬럼명 -> ID (같은 이름은 먼저 등록된 쌍 사용)
+    def field_ids(self):
+        ids = {}
+        for col in sorted(self.columns, key=lambda c: c["id"]):
+            if col["kind"] == "field":
+                ids.setdefault(col["name"], col["id"])
+        return ids
+
+    def grid_sections(self):
+        sections = []
+        for col in sorted(self.columns, key=lambda c: c["id"]):
+            if col["kind"] == "grid" and col["section"] != FILES_SECTION and col["section"] not in sections:
+                sections.append(col["section"])
+        return sections
+
+    def column_types(self):
+        types = {}
+        for col in sorted(self.columns, key=lambda c: c["id"]):
+            if col["kind"] == "field" and col["type"]:
+                types.setdefault(col["name"], col["type"])
+        return types
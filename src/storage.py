@@ -4,13 +4,35 @@ import json
 import signal
 import asyncio
 import atexit
-import pandas as pd
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
+from src.exporter import append_excel
+from src.normalize import normalize_record, TYPED_VERSION
+from src.aggregates import AggregateStore
+from src.long_store import LongStore
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 수집 완료 ID 파일 읽기 (저장소 소유 여부와 관계없이 읽기 전용으로 사용 가능)
+def load_visited_ids(visited_file):
+    ids = set()
+    if os.path.exists(visited_file):
+        try:
+            with open(visited_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    clean_id = line.strip()
+                    if clean_id:
+                        ids.add(clean_id)
+        except Exception as e:
+            logger.error("Loading visited IDs failed: %s", e)
+    return ids
 
 class DataStorage:
-    def __init__(self, save_dir="data"):
+    def __init__(self, save_dir="data", alert_engine=None):
         self.save_dir = save_dir
+        # 신규 공고 알림 (None이면 사용 안 함)
+        self.alert_engine = alert_engine
         
         if not os.path.exists(self.save_dir):
             os.makedirs(self.save_dir)
@@ -24,6 +46,14 @@ class DataStorage:
         
         self.visited_ids = self._load_visited_ids()
 
+        # 대시보드용 요약 통계 (저장 시 증분 갱신)
+        self.aggregates = AggregateStore(self.save_dir)
+        self.aggregates.ensure_built(self.output_file)
+
+        # 세로형 저장소 (대시보드/내보내기에서 필요한 컬럼만 펼쳐 사용)
+        self.long_store = LongStore(self.save_dir)
+        self.long_store.ensure_built(self.output_file)
+
         self.excel_buffer = [] 
         self.BUFFER_SIZE = 10  # 데이터 10개마다 엑셀 저장
         self.executor = ThreadPoolExecutor(max_workers=1) 
@@ -35,32 +65,25 @@ class DataStorage:
         signal.signal(signal.SIGINT, self._handle_sigterm)
 
     def _handle_sigterm(self, signum, frame):
-        print("[SYSTEM] Docker 종료 신호 감지. 데이터 저장 중...")
+        logger.info("Docker 종료 신호 감지. 데이터 저장 중...")
         self._cleanup()
-        print("[SYSTEM] 종료 완료.")
+        logger.info("종료 완료.")
         sys.exit(0)
 
     def _cleanup(self):
+        if self.alert_engine:
+            self.alert_engine.close()
+
         if not self.excel_buffer:
             return
 
         if self.excel_buffer:
-            print(f"[INFO] 프로그램 종료 전 버퍼에 남은 {len(self.excel_buffer)}건 엑셀 저장 중...")
+            logger.info("프로그램 종료 전 버퍼에 남은 %d건 엑셀 저장 중...", len(self.excel_buffer))
             self._flush_to_excel(self.excel_buffer, is_async=False)
             self.excel_buffer = []
 
     def _load_visited_ids(self):
-        ids = set()
-        if os.path.exists(self.visited_file):
-            try:
-                with open(self.visited_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        clean_id = line.strip()
-                        if clean_id:
-                            ids.add(clean_id)
-            except Exception as e:
-                print(f"[ERROR] Loading visited IDs failed: {e}")
-        return ids
+        return load_visited_ids(self.visited_file)
 
     def is_new(self, notice_id):
         return notice_id not in self.visited_ids
@@ -76,14 +99,30 @@ class DataStorage:
                 with open(self.visited_file, "a", encoding="utf-8") as f:
                     f.write(f"{notice_id}\n")
 
+            # 금액/일시 타입 변환 값을 원본 옆에 함께 저장
+            data_dict["typed"] = normalize_record(data_dict)
+            data_dict["typed_version"] = TYPED_VERSION
+
             # 데이터 저장 (JSONL 방식 - 한 줄에 JSON 하나씩 추가)
             json_str = json.dumps(data_dict, ensure_ascii=False)
             with open(self.output_file, "a", encoding="utf-8") as f:
                 f.write(json_str + "\n")
-            
+        except Exception as e:
+            logger.error("Save failed: %s", e, extra={"notice_id": notice_id, "phase": "save"})
+            return
+
+        # 요약 통계/세로형 저장소/알림/엑셀은 서로 독립적으로 처리 (하나가 실패해도 나머지는 진행)
+        # 요약 통계와 세로형 저장소의 누락분은 다음 시작 시 JSONL과 비교하여 보정됨
+        self._run_sink("aggregates", self.aggregates.update, data_dict, notice_id)
+        self._run_sink("long_store", self.long_store.add, data_dict, notice_id)
+        # 알림 규칙 검사 (백그라운드 처리)
+        if self.alert_engine:
+            self._run_sink("alerts", self.alert_engine.submit, data_dict, notice_id)
+
+        try:
             # 2. [버퍼링] 엑셀용 버퍼에 담기
             self.excel_buffer.append(data_dict)
-            print(f"[INFO] Saved: {notice_id}")
+            logger.info("Saved", extra={"notice_id": notice_id, "phase": "save"})
             
             if len(self.excel_buffer) >= self.BUFFER_SIZE:
                 data_to_save = self.excel_buffer[:]
@@ -97,71 +136,27 @@ class DataStorage:
                 )
 
         except Exception as e:
-            print(f"[ERROR] Save failed ({notice_id}): {e}")
+            logger.error("Excel buffering failed: %s", e, extra={"notice_id": notice_id, "phase": "excel"})
+
+    def _run_sink(self, name, func, data_dict, notice_id):
+        try:
+            func(data_dict)
+        except Exception as e:
+            logger.error("Updating %s failed: %s", name, e, extra={"notice_id": notice_id, "phase": "save"})
 
     def _flush_to_excel(self, data_list, is_async=True):
         try:
-            # 데이터 변환 (Jsonl -> 엑셀 Row)
-            flattened_rows = []
-            for item in data_list:
-                row = {
-                    "수집ID": item.get("id"),
-                    "공고명": item.get("title"),
-                    "수집일시": item.get("crawled_at")
-                }
-                
-                sections = item.get("sections", {})
-                for section_name, section_data in sections.items():
-                    
-                    # 테이블 데이터 - 키를 컬럼으로 사용
-                    if isinstance(section_data, dict):
-                        for key, value in section_data.items():
-                            # 컬럼명 충돌 방지 (섹션명_키)
-                            # 공고일반은 자주 쓰니까 접두어 없이, 나머지는 접두어 붙임
-                            col_name = key if section_name == "공고일반" else f"{section_name}_{key}"
-                            if col_name not in row:
-                                row[col_name] = value
-
-                    # 그리드 데이터 - 요약 정보로 변환
-                    elif isinstance(section_data, list):
-                        summary_list = []
-                        for idx, grid_row in enumerate(section_data):
-                            row_str = " | ".join([str(v) for v in grid_row.values()])
-                            summary_list.append(f"[{idx+1}] {row_str}")                        
-                        row[section_name] = "\n".join(summary_list)
-                
-                # 첨부파일 정보 요약
-                files = item.get("files", [])
-                row["첨부파일_개수"] = len(files)
-                
-                file_names = []
-                for f in files:
-                    name = f.get("파일명") or f.get("orgnlAtchFileNm")
-                    file_names.append(name)
-                    
-                row["첨부파일_목록"] = "\n".join(file_names)
-
-                flattened_rows.append(row)
-
-            new_df = pd.DataFrame(flattened_rows)
-
-            # 기존 엑셀 파일이 있으면 합치기
-            if os.path.exists(self.output_excel):
-                existing_df = pd.read_excel(self.output_excel)
-                final_df = pd.concat([existing_df, new_df], ignore_index=True)
-            else:
-                final_df = new_df
             if not is_async:
-                print("종료 전 엑셀 저장 실행")
+                logger.info("종료 전 엑셀 저장 실행")
 
-            # 최종 저장
-            final_df.to_excel(self.output_excel, index=False)
-            print(f"[Excel] {len(data_list)}건 백그라운드 저장 완료 (Total: {len(final_df)}행)")
+            # 기존 행은 그대로 두고 새 행만 추가 (openpyxl은 저장 시점에만 로드)
+            total_rows = append_excel(self.output_excel, data_list)
+            logger.info("%d건 백그라운드 엑셀 저장 완료 (Total: %d행)", len(data_list), total_rows, extra={"phase": "excel"})
 
         except PermissionError:
-            print(f"[WARN] 엑셀 파일이 열려있어 저장 실패! 닫고 다시 시도하세요: {self.output_excel}")
+            logger.warning("엑셀 파일이 열려있어 저장 실패! 닫고 다시 시도하세요: %s", self.output_excel)
         except Exception as e:
-            print(f"[WARN] 엑셀 저장 중 오류: {e}")
+            logger.warning("엑셀 저장 중 오류: %s", e)
 
     def get_stats(self):
         return len(self.visited_ids)
\ No newline at end of file
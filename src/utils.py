@@ -1,6 +1,10 @@
 from datetime import datetime, timedelta
 import re
 
+# 전처리용 정규식 (호출마다 컴파일하지 않도록 모듈 로드 시 한 번만 생성)
+DATE_TIME_JOINED = re.compile(r'(\d{4}/\d{2}/\d{2})(\d{2}:\d{2})')
+WHITESPACE = re.compile(r'\s+')
+
 # 현재 날짜를 YYYYMMDD 문자열로 반환
 def get_today_str():
     return datetime.now().strftime("%Y%m%d")
@@ -15,8 +19,7 @@ def clean_text(text):
         return ""
     
     # 날짜 포맷 정규화 
-    date_pattern = re.compile(r'(\d{4}/\d{2}/\d{2})(\d{2}:\d{2})')
-    text = date_pattern.sub(r'\1 \2', text)
+    text = DATE_TIME_JOINED.sub(r'\1 \2', text)
 
     # 금액이 없는 경우, 0 원 처리
     if text == "원":
@@ -26,7 +29,7 @@ def clean_text(text):
     text = str(text).replace("\xa0", " ")
     
     # 줄바꿈, 탭, 연속된 공백을 스페이스 하나로 통일하고 양쪽 공백 제거
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = WHITESPACE.sub(' ', text).strip()
     
     # 공백 제거 및 줄바꿈 문자를 공백으로 치환
     return text.strip().replace("\n", " ").replace("\r", "")
\ No newline at end of file
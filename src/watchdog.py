@@ -0,0 +1,87 @@
+import os
+
+# 장시간 수집 시 브라우저 메모리 감시
+# 렌더러 JS 힙(CDP Performance.getMetrics)과 크롬 프로세스 RSS를 확인하여
+# 공고 N건 처리 또는 메모리 임계치 초과 시 페이지/컨텍스트 재생성 시점을 알려줍니다.
+class MemoryWatchdog:
+    def __init__(self, max_notices=300, max_heap_mb=512, max_rss_mb=2048, check_every=10):
+        self.max_notices = max_notices
+        self.max_heap_mb = max_heap_mb
+        self.max_rss_mb = max_rss_mb
+        self.check_every = check_every
+
+        self.notices = 0
+        self.recycles = 0
+        self._cdp = None
+        self._cdp_page = None
+
+    def notice_done(self):
+        self.notices += 1
+
+    def reset(self):
+        self.notices = 0
+        self.recycles += 1
+        self._cdp = None
+        self._cdp_page = None
+
+    # 렌더러 JS 힙 사용량 (MB)
+    async def get_heap_mb(self, page):
+        try:
+            if self._cdp is None or self._cdp_page is not page:
+                self._cdp = await page.context.new_cdp_session(page)
+                await self._cdp.send("Performance.enable")
+                self._cdp_page = page
+            result = await self._cdp.send("Performance.getMetrics")
+            for metric in result.get("metrics", []):
+                if metric["name"] == "JSHeapUsedSize":
+                    return metric["value"] / (1024 * 1024)
+        except Exception:
+            self._cdp = None
+        return None
+
+    # 현재 프로세스와 하위 프로세스(크롬 브라우저/렌더러)의 RSS 합계 (MB, Linux 전용)
+    def get_rss_mb(self):
+        if not os.path.isdir("/proc"):
+            return None
+
+        children = {}
+        rss_pages = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "r") as f:
+                    # 프로세스명에 공백이 있을 수 있어 마지막 ')' 이후를 파싱
+                    fields = f.read().rsplit(")", 1)[1].split()
+                ppid = int(fields[1])
+                children.setdefault(ppid, []).append(int(entry))
+                rss_pages[int(entry)] = int(fields[21])
+            except (OSError, IndexError, ValueError):
+                continue
+
+        total = 0
+        stack = [os.getpid()]
+        while stack:
+            pid = stack.pop()
+            total += rss_pages.get(pid, 0)
+            stack.extend(children.get(pid, []))
+
+        return total * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+    # 재생성이 필요하면 사유 문자열, 아니면 None
+    async def check(self, page):
+        if self.max_notices and self.notices >= self.max_notices:
+            return f"{self.notices} notices processed"
+
+        if not self.check_every or self.notices % self.check_every != 0:
+            return None
+
+        heap_mb = await self.get_heap_mb(page)
+        if heap_mb is not None and self.max_heap_mb and heap_mb > self.max_heap_mb:
+            return f"JS heap {heap_mb:.0f}MB > {self.max_heap_mb}MB"
+
+        rss_mb = self.get_rss_mb()
+        if rss_mb is not None and self.max_rss_mb and rss_mb > self.max_rss_mb:
+            return f"RSS {rss_mb:.0f}MB > {self.max_rss_mb}MB"
+
+        return None
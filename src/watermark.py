@@ -0,0 +1,87 @@
+import os
+import json
+from datetime import datetime, timedelta
+from src.normalize import get_typed
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 증분 수집 기준점 (워터마크)
+# 마지막으로 성공한 수집에서 본 가장 최근 게시일시와, 같은 일시에 게시된 공고번호 목록을 data/watermark.json에 보관합니다.
+# 다음 수집은 워터마크 날짜부터 오늘까지 검색하므로 컨테이너가 내려가 있던 기간도 자동으로 채워지며,
+# 같은 분에 게시된 공고는 공고번호 목록으로 구분합니다. 수집이 모두 성공한 경우에만 갱신됩니다.
+
+class CrawlWatermark:
+    def __init__(self, path="data/watermark.json"):
+        self.path = path
+        self.posted_at = None
+        self.boundary_ids = set()
+        self._load()
+
+        # 이번 수집 중 관찰한 값 (commit 전까지 파일에 반영하지 않음)
+        self.pending_at = self.posted_at
+        self.pending_ids = set(self.boundary_ids)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self.posted_at = datetime.fromisoformat(state["posted_at"])
+            self.boundary_ids = set(state.get("ids", []))
+        except Exception as e:
+            logger.warning("Loading watermark failed, starting fresh: %s", e)
+
+    # 검색 기간 (워터마크가 없으면 어제부터)
+    def search_window(self, today=None):
+        today = today or datetime.now()
+        if self.posted_at is None:
+            start = today - timedelta(days=1)
+        else:
+            start = self.posted_at
+            gap_days = (today.date() - start.date()).days
+            if gap_days > 1:
+                logger.info("Backfilling %d days since last watermark.", gap_days, extra={"phase": "watermark"})
+        return start.strftime("%Y%m%d"), today.strftime("%Y%m%d")
+
+    # 크롤러 컷오프 (YYYYMMDDHHMM, 워터마크 이전 공고는 건너뜀)
+    def cutoff(self):
+        return self.posted_at.strftime("%Y%m%d%H%M") if self.posted_at else None
+
+    # 저장된 공고의 게시일시 반영
+    def observe(self, record):
+        posted = None
+        for key, value in get_typed(record).get("공고일반", {}).items():
+            if "게시일" in key and isinstance(value, str):
+                posted = datetime.fromisoformat(value)
+                break
+        if posted is None:
+            return
+
+        if self.pending_at is None or posted > self.pending_at:
+            self.pending_at = posted
+            self.pending_ids = {record.get("id")}
+        elif posted == self.pending_at:
+            self.pending_ids.add(record.get("id"))
+
+    # 수집 성공 시 워터마크 갱신 (원자적 파일 교체)
+    def commit(self):
+        if self.pending_at is None:
+            return
+        if self.pending_at == self.posted_at and self.pending_ids == self.boundary_ids:
+            return
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "posted_at": self.pending_at.isoformat(),
+                    "ids": sorted(self.pending_ids),
+                    "updated_at": datetime.now().isoformat()
+                }, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+            self.posted_at = self.pending_at
+            self.boundary_ids = set(self.pending_ids)
+            logger.info("Watermark advanced to %s", self.posted_at.isoformat(), extra={"phase": "watermark"})
+        except Exception as e:
+            logger.warning("Saving watermark failed: %s", e)
@@ -0,0 +1,209 @@
+import os
+import json
+import time
+import sqlite3
+from datetime import datetime, timedelta
+
+# 여러 크롤러 컨테이너가 공유하는 작업 큐 (SQLite 기반)
+# 작업(날짜 구간, 공고번호)은 임대(lease) 방식으로 배분되며,
+# 하트비트가 끊긴 작업은 임대 만료 후 다른 워커가 재시도합니다.
+# 수집 결과는 results 테이블에 쌓이고, 저장소 쓰기는 코디네이터 한 곳에서만 수행합니다.
+# 네트워크 브로커로 교체할 경우 동일한 메서드를 가진 클래스를 구현하면 됩니다.
+class WorkQueue:
+    def __init__(self, db_path="data/work_queue.db", lease_seconds=300, max_attempts=3):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    def _init_db(self):
+        conn = self._connect()
+        try:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    owner TEXT,
+                    lease_until REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    updated_at REAL,
+                    UNIQUE (kind, payload)
+                );
+                CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, id);
+                CREATE TABLE IF NOT EXISTS results (
+                    notice_id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    written INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_results_written ON results (written, created_at);
+            """)
+        finally:
+            conn.close()
+
+    # 작업 등록 (이미 등록된 작업은 무시)
+    def enqueue(self, kind, payload):
+        conn = self._connect()
+        try:
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO tasks (kind, payload, updated_at) VALUES (?, ?, ?)",
+                (kind, payload, time.time())
+            )
+            return cur.rowcount > 0
+        finally:
+            conn.close()
+
+    # 기간을 하루 단위 작업으로 분할하여 등록
+    def enqueue_date_shards(self, start_date, end_date):
+        start_dt = datetime.strptime(start_date, "%Y%m%d")
+        end_dt = datetime.strptime(end_date, "%Y%m%d")
+        added = 0
+        day = end_dt
+        # 최신 날짜부터 처리
+        while day >= start_dt:
+            if self.enqueue("date", day.strftime("%Y%m%d")):
+                added += 1
+            day -= timedelta(days=1)
+        return added
+
+    # 대기 중인 작업 하나를 임대
+    def lease(self, worker_id):
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+
+            # 임대 만료 작업 회수
+            conn.execute(
+                "UPDATE tasks SET status = 'pending', owner = NULL, updated_at = ? "
+                "WHERE status = 'leased' AND lease_until < ? AND attempts < ?",
+                (now, now, self.max_attempts)
+            )
+            conn.execute(
+                "UPDATE tasks SET status = 'failed', owner = NULL, last_error = 'lease expired', updated_at = ? "
+                "WHERE status = 'leased' AND lease_until < ? AND attempts >= ?",
+                (now, now, self.max_attempts)
+            )
+
+            row = conn.execute(
+                "SELECT id, kind, payload, attempts FROM tasks WHERE status = 'pending' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            conn.execute(
+                "UPDATE tasks SET status = 'leased', owner = ?, lease_until = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE id = ?",
+                (worker_id, now + self.lease_seconds, now, row[0])
+            )
+            conn.execute("COMMIT")
+            return {"id": row[0], "kind": row[1], "payload": row[2], "attempts": row[3] + 1}
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    # 임대 연장 (다른 워커에게 넘어간 작업이면 False)
+    def heartbeat(self, task_id, worker_id):
+        conn = self._connect()
+        try:
+            cur = conn.execute(
+                "UPDATE tasks SET lease_until = ?, updated_at = ? WHERE id = ? AND owner = ? AND status = 'leased'",
+                (time.time() + self.lease_seconds, time.time(), task_id, worker_id)
+            )
+            return cur.rowcount > 0
+        finally:
+            conn.close()
+
+    def complete(self, task_id, worker_id):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE tasks SET status = 'done', owner = NULL, updated_at = ? WHERE id = ? AND owner = ?",
+                (time.time(), task_id, worker_id)
+            )
+        finally:
+            conn.close()
+
+    # 실패 처리 (재시도 횟수가 남아 있으면 대기 상태로 되돌림)
+    def fail(self, task_id, worker_id, error):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, "
+                "owner = NULL, last_error = ?, updated_at = ? WHERE id = ? AND owner = ?",
+                (self.max_attempts, str(error)[:500], time.time(), task_id, worker_id)
+            )
+        finally:
+            conn.close()
+
+    # 워커가 수집한 공고 등록
+    def push_result(self, notice_id, data_dict):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR IGNORE INTO results (notice_id, data, created_at) VALUES (?, ?, ?)",
+                (notice_id, json.dumps(data_dict, ensure_ascii=False), time.time())
+            )
+        finally:
+            conn.close()
+
+    def has_result(self, notice_id):
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT 1 FROM results WHERE notice_id = ?", (notice_id,)).fetchone()
+            return row is not None
+        finally:
+            conn.close()
+
+    # 저장소에 아직 기록되지 않은 결과 조회 (코디네이터 전용)
+    def fetch_unwritten(self, limit=100):
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT notice_id, data FROM results WHERE written = 0 ORDER BY created_at LIMIT ?",
+                (limit,)
+            ).fetchall()
+            return [(notice_id, json.loads(data)) for notice_id, data in rows]
+        finally:
+            conn.close()
+
+    def mark_written(self, notice_ids):
+        if not notice_ids:
+            return
+        conn = self._connect()
+        try:
+            conn.executemany("UPDATE results SET written = 1 WHERE notice_id = ?", [(i,) for i in notice_ids])
+        finally:
+            conn.close()
+
+    def stats(self):
+        conn = self._connect()
+        try:
+            counts = dict(conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall())
+            counts["unwritten"] = conn.execute("SELECT COUNT(*) FROM results WHERE written = 0").fetchone()[0]
+            return counts
+        finally:
+            conn.close()
+
+    # 대기/진행 중인 작업이 남아 있는지
+    def has_open_tasks(self):
+        stats = self.stats()
+        return stats.get("pending", 0) + stats.get("leased", 0) > 0